@@ -1,4 +1,19 @@
 from .core.models.file_entry import FileEntry
 from .core.models.renaming_method import RenamingMethod
-from .core.renamer import TVShowRenamer
-from .gui.dialogs.show_dialog import ShowInputDialog
+from .core.models.tmdb_show import TMDbShow
+from .core.models.undo_batch import UndoBatch
+
+# The renamer and show dialog pull in tmdbv3api/requests; resolve them lazily
+# so importing any src module does not pay for TMDb setup.
+_LAZY_IMPORTS = {
+    "TVShowRenamer": ".core.renamer",
+    "ShowInputDialog": ".gui.dialogs.show_dialog",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,30 @@
 import os
+from typing import Optional
 
 class FileEntry:
-    def __init__(self, path: str, new_name: str = ""):
+    # One per listed file; slots keep large lists from paying for a __dict__ each
+    __slots__ = (
+        "path",
+        "original_name",
+        "directory",
+        "stem",
+        "ext",
+        "new_name",
+        "status",
+        "tree_iid",
+        "ctime",
+    )
+
+    def __init__(
+        self, path: str, new_name: str = "", stat_result: Optional[os.stat_result] = None
+    ):
         self.path = path
         self.original_name = os.path.basename(path)
+        # Split once here; renames stay in the same directory
+        self.directory = os.path.dirname(path)
+        self.stem, self.ext = os.path.splitext(self.original_name)
         self.new_name = new_name
         self.status = "Pending"
+        self.tree_iid: Optional[str] = None
+        # Taken from the stat done when the file was added, so previews need no syscalls
+        self.ctime: Optional[float] = stat_result.st_ctime if stat_result else None
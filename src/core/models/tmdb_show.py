@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+# __slots__ is declared by hand because dataclass(slots=True) needs Python 3.10
+@dataclass
+class TMDbShow:
+    __slots__ = ("id", "name", "first_air_date", "overview")
+
+    id: int
+    name: str
+    first_air_date: str
+    overview: str
+
+    @classmethod
+    def from_tmdb(cls, show) -> "TMDbShow":
+        """Build from a tmdbv3api search result, keeping only the fields the app uses"""
+        return cls(
+            id=show.id,
+            name=show.name,
+            first_air_date=getattr(show, "first_air_date", None) or "N/A",
+            overview=(getattr(show, "overview", "") or "")[:200],
+        )
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+
+
+@dataclass
+class UndoBatch:
+    """One undoable batch: renamed paths and their original names, index-aligned"""
+
+    __slots__ = ("timestamp", "paths", "names")
+
+    timestamp: float
+    paths: List[str]
+    names: List[str]
+
+    def add(self, path: str, original_name: str):
+        """Record that path should be renamed back to original_name"""
+        self.paths.append(path)
+        self.names.append(original_name)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form used by the undo log"""
+        return {"timestamp": self.timestamp, "paths": self.paths, "names": self.names}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "UndoBatch":
+        """Inverse of to_dict; also reads the older {"timestamp": iso, "files": [...]} form"""
+        if "files" in data:
+            return cls(
+                timestamp=datetime.fromisoformat(data["timestamp"]).timestamp(),
+                paths=[path for path, _ in data["files"]],
+                names=[name for _, name in data["files"]],
+            )
+        return cls(
+            timestamp=float(data["timestamp"]),
+            paths=list(data["paths"]),
+            names=list(data["names"]),
+        )
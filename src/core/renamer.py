@@ -1,18 +1,149 @@
 import os
 import re
+import threading
 import time
+from functools import wraps
 from typing import Dict, List, Optional, Tuple
-from tmdbv3api import TMDb, TV, Episode, Search
-from dotenv import load_dotenv
+from src.utils.disk_cache import DEFAULT_CACHE_DIR, DiskCache
 from src.utils.logger import setup_logger, log_safely, format_show_name
 
+# google-re2 is optional; when installed, its linear-time DFA engine is used
+# for the patterns it supports (no lookarounds)
+try:
+    import re2 as _fast_re  # type: ignore
+except ImportError:
+    _fast_re = re
+
+# Lookup timings are only recorded when TVRENAMER_PROFILE is set, so the
+# timing decorator costs nothing in normal runs
+PROFILING_ENABLED = bool(os.environ.get("TVRENAMER_PROFILE"))
+
+# Disk cache lifetimes in seconds; aired episodes never expire
+SHOW_CACHE_TTL = 30 * 24 * 60 * 60
+SEASON_CACHE_TTL = 7 * 24 * 60 * 60
+UNAIRED_EPISODE_CACHE_TTL = 24 * 60 * 60
+
+# Characters not allowed in filenames, mapped to "_" with one str.translate pass
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# Common TV show filename patterns, in priority order
+_SHOW_PATTERNS = [
+    # Pattern: Show.Name.S01E02 or Show.Name.S1E02
+    r"^(?P<show>.*?)[\. _]S0?(?P<season>\d{1,2})E(?P<episode>\d{1,2})",
+    # Pattern: Show.Name.1x02 or Show.Name.01x02
+    r"^(?P<show>.*?)[\. _]0?(?P<season>\d{1,2})x(?P<episode>\d{1,2})",
+    # Pattern: Show.Name.102 (assuming first digit is season, next two are episode)
+    r"^(?P<show>.*?)[\. _](?P<season>\d{1})(?P<episode>\d{2})\D",
+    # Pattern: Show.Name.Season.1.Episode.02
+    r"^(?P<show>.*?)[\. _]Season[\. _]0?(?P<season>\d{1,2})[\. _]Episode[\. _](?P<episode>\d{1,2})",
+    # Pattern: Show.Name.E02.S01
+    r"^(?P<show>.*?)[\. _]E(?P<episode>\d{1,2})[\. _]S0?(?P<season>\d{1,2})",
+]
+
+
+def _union_patterns(patterns: List[str]):
+    """Compile patterns into one alternation so a filename is scanned once.
+
+    Every alternative is anchored, so the first one in list order wins and
+    the outer p{i} group tells us which pattern matched.
+    """
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        # Suffix group names with the pattern index to keep them unique
+        pattern = re.sub(r"\(\?P<(\w+)>", rf"(?P<\g<1>{i}>", pattern)
+        alternatives.append(f"(?P<p{i}>{pattern})")
+    return _fast_re.compile("(?i)" + "|".join(alternatives))
+
+
+# Filename patterns, compiled once at import and shared by every renamer
+_SHOW_RE = _union_patterns(_SHOW_PATTERNS)
+# Special handling for episode-only format with show title
+_EPISODE_ONLY_RE = _fast_re.compile(r"(?i)^(\d{1,2})[\. _]-[\. _](.*?)\..*$")
+_SEASON_RE = _fast_re.compile(r"(?i)season[\. _](\d+)")
+
+# Patterns to match episode numbers, tried in priority order. These rely on
+# lookarounds, which re2 does not support.
+_EPISODE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"_-_(\d{2})(?:_|\(|$)",  # Match _-_01 format specifically
+        r"E(\d{1,3})(?!\d)",  # Match E01, E1, E123, etc.
+        r"^(\d{1,2})[\. _]-",  # Match episode numbers at start (e.g., "01 - ")
+        r"(?<!\d)\d{1,2}x(\d{1,2})(?!\d)",  # Match 1x01 format
+        r"(?<!\d)(\d{2})(?!\d)",  # Match a standalone two-digit number
+        r"(?<!\d)\d(\d{2})(?!\d)",  # Match 102 format (season digit + episode)
+    )
+]
+
+# Every season/episode pattern needs a digit; filenames without one are
+# rejected before any of the larger patterns run
+_HAS_DIGIT_RE = _fast_re.compile(r"\d")
+_BRACKET_RE = _fast_re.compile(r"\[.*?\]")
+# Show cache keys ignore punctuation and spacing but keep a trailing release
+# year, written as "(2005)" or as a separate bare 2005 after the title
+_YEAR_SUFFIX_RE = _fast_re.compile(
+    r"^(?P<name>.*\S)[\s._]*\((?P<paren>\d{4})\)$|^(?P<title>.*\S)[\s._]+(?P<bare>\d{4})$"
+)
+# A bare four-digit suffix only counts as a year from here to next year, so
+# titles like "The 4400" or "Blade Runner 2049" keep their number
+MIN_SHOW_YEAR = 1900
+_NORM_RE = _fast_re.compile(r"[^a-z0-9]+")
+_UNDERSCORE_SPACE_RE = re.compile(r"_\s+")
+_SPACE_UNDERSCORE_RE = re.compile(r"\s+_")
+_MULTI_SPACE_RE = re.compile(r"\s+")
+
+
+def _scan_sxxexx(name: str) -> Optional[Tuple[str, str, str]]:
+    """Match the Show.Name.S01E02 pattern without the regex engine.
+
+    Returns the same (show, season, episode) groups as the first pattern in
+    _SHOW_PATTERNS, or None so the caller falls back to _SHOW_RE. Only plain
+    ASCII names are scanned, since that is where str.isdigit() and the
+    case-insensitive S/E agree exactly with the regex.
+    """
+    if not name.isascii():
+        return None
+
+    lowered = name.lower()
+    # "." in the show group never crosses a newline
+    end = lowered.find("\n")
+    if end == -1:
+        end = len(lowered)
+    size = len(lowered)
+
+    pos = lowered.find("s", 1, end)
+    while pos != -1:
+        if lowered[pos - 1] in "._ ":
+            # Same backtracking order as S0?(\d{1,2})E(\d{1,2})
+            starts = (pos + 2, pos + 1) if lowered[pos + 1 : pos + 2] == "0" else (pos + 1,)
+            for start in starts:
+                for width in (2, 1):
+                    mark = start + width
+                    if (
+                        mark + 1 < size
+                        and lowered[start:mark].isdigit()
+                        and lowered[mark] == "e"
+                        and lowered[mark + 1].isdigit()
+                    ):
+                        stop = mark + 3 if lowered[mark + 2 : mark + 3].isdigit() else mark + 2
+                        return name[: pos - 1], name[start:mark], name[mark + 1 : stop]
+        pos = lowered.find("s", pos + 1, end)
+    return None
+
 
 class TVShowRenamer:
-    def __init__(self, parent):
+    def __init__(self, parent, cache_dir: str = DEFAULT_CACHE_DIR):
         """
         Initialize the TVShowRenamer class by loading environment variables,
-        setting up the TMDb API, and initializing TV, Search, and Episode objects.
+        setting up the TMDb API, and initializing TV, Search, Season and Episode objects.
+        Lookups are cached in memory and persisted to disk under cache_dir.
         """
+        # tmdbv3api pulls in requests; import it (and dotenv) only when a
+        # renamer is created
+        from dotenv import load_dotenv
+        from tmdbv3api import TMDb, TV, Episode, Search, Season
+        from src.utils.tmdb_session import get_tmdb_session
+
         self.parent = parent
         load_dotenv()
         api_key = os.getenv("TMDB_API_KEY")
@@ -22,17 +153,25 @@ class TVShowRenamer:
         # Set up secure logging
         self.logger = setup_logger(__name__)
 
-        self.tmdb = TMDb()
+        # Share one keep-alive session with the show dialog. tmdbv3api's own
+        # response cache bypasses the session; lookups are cached here instead.
+        self.tmdb = TMDb(session=get_tmdb_session())
         self.tmdb.api_key = api_key
         self.tmdb.language = "en"
+        self.tmdb.cache = False
 
         self.tv = TV()
         self.search = Search()
         self.episode = Episode()
+        self.season_api = Season()
         self.show_cache: Dict[str, Dict] = {}
-        self.season_cache = {}
-        self.episode_cache = {}
+        self.season_cache: Dict[Tuple[int, int], Dict] = {}
+        self.episode_cache: Dict[Tuple[int, int, int], Dict] = {}
         self.search_cache = {}
+        self._disk = DiskCache(cache_dir)
+
+        # Lookups may run on worker threads; the lock guards counters and caches
+        self._lock = threading.Lock()
 
         # Add API call counters
         self.api_call_count = {
@@ -45,21 +184,28 @@ class TVShowRenamer:
         # Add cache hit counters
         self.cache_hits = {"show": 0, "season": 0, "episode": 0, "search": 0}
 
+        # Timings in nanoseconds; the per-thread flag records whether the
+        # current lookup was served from cache
         self.performance_stats = {"api_times": [], "cache_times": []}
+        self._profile = threading.local()
 
     def measure_performance(func):
-        """Decorator to measure function execution time"""
+        """Decorator to measure function execution time when profiling is enabled"""
+        if not PROFILING_ENABLED:
+            return func
 
+        @wraps(func)
         def wrapper(self, *args, **kwargs):
-            start_time = time.time()
+            self._profile.cache_hit = False
+            start_time = time.perf_counter_ns()
             result = func(self, *args, **kwargs)
-            end_time = time.time()
+            elapsed = time.perf_counter_ns() - start_time
 
-            # Store timing based on whether it was a cache hit
-            if result and any(hit > 0 for hit in self.cache_hits.values()):
-                self.performance_stats["cache_times"].append(end_time - start_time)
+            # Store timing based on whether this lookup was a cache hit
+            if self._profile.cache_hit:
+                self.performance_stats["cache_times"].append(elapsed)
             else:
-                self.performance_stats["api_times"].append(end_time - start_time)
+                self.performance_stats["api_times"].append(elapsed)
 
             return result
 
@@ -72,20 +218,23 @@ class TVShowRenamer:
         Searches TMDB for best show name match.
         Returns (show_name, season_number, episode_number) or None if no match.
         """
-        self.logger.debug(f"Extracting show info from filename: {filename}")
+        self.logger.debug("Extracting show info from filename: %s", filename)
+
+        # Strip [tag] sections once so the patterns never see bracketed noise
+        cleaned = _BRACKET_RE.sub("", filename).strip()
+        if not _HAS_DIGIT_RE.search(cleaned):
+            self.logger.debug("No digits in filename, skipping: %s", filename)
+            return None
 
         # Special handling for episode-only format with show title
-        episode_only_pattern = r"^(\d{1,2})[\. _]-[\. _](.*?)(?:\[.*?\])*\..*$"
-        match = re.search(episode_only_pattern, filename, re.IGNORECASE)
+        match = _EPISODE_ONLY_RE.search(cleaned)
         if match:
             try:
                 episode_num = int(match.group(1))
                 show_title = match.group(2).strip()
 
                 # Try to find season number in the title
-                season_match = re.search(
-                    r"season[\. _](\d+)", show_title, re.IGNORECASE
-                )
+                season_match = _SEASON_RE.search(show_title)
                 if season_match:
                     season_num = int(season_match.group(1))
                 else:
@@ -94,66 +243,50 @@ class TVShowRenamer:
                         season_num = self.current_season
                     else:
                         self.logger.warning(
-                            f"No season information found for: {filename}"
+                            "No season information found for: %s", filename
                         )
                         return None
 
-                # Remove any remaining tags in square brackets
-                show_title = re.sub(r"\[.*?\]", "", show_title).strip()
                 # Clean up the show title
-                show_title = show_title.split("-")[0].strip()
+                show_title = show_title.partition("-")[0].strip()
 
                 self.logger.debug(
-                    f"Matched episode-only format: Show='{show_title}', S{season_num:02d}E{episode_num:02d}"
+                    "Matched episode-only format: Show='%s', S%02dE%02d",
+                    show_title, season_num, episode_num,
                 )
                 return show_title, season_num, episode_num
 
             except (IndexError, ValueError) as e:
-                self.logger.error(f"Error parsing episode-only format: {e}")
+                self.logger.error("Error parsing episode-only format: %s", e)
                 return None
 
-        # Common TV show filename patterns
-        patterns = [
-            # Pattern: [Tag]Show_-_01 (metadata)
-            r"^\[.*?\](.*?)_-_(\d{2})(?:_|\(|$)",
-            # Pattern: [Tag]Show_-_01 format
-            r"^\[.*?\](.*?)_-_(\d{2})(?:_|\()",
-            # Pattern: Show.Name.S01E02 or Show.Name.S1E02
-            r"^(.*?)[\. _]S0?(\d{1,2})E(\d{1,2})",
-            # Pattern: Show.Name.1x02 or Show.Name.01x02
-            r"^(.*?)[\. _]0?(\d{1,2})x(\d{1,2})",
-            # Pattern: Show.Name.102 (assuming first digit is season, next two are episode)
-            r"^(.*?)[\. _](\d{1})(\d{2})\D",
-            # Pattern: Show.Name.Season.1.Episode.02
-            r"^(.*?)[\. _]Season[\. _]0?(\d{1,2})[\. _]Episode[\. _](\d{1,2})",
-            # Pattern: Show.Name.E02.S01
-            r"^(.*?)[\. _]E(\d{1,2})[\. _]S0?(\d{1,2})",
-        ]
-
-        # Try standard patterns
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
-            if match:
-                try:
-                    raw_show_name = match.group(1).replace(".", " ").strip()
-                    season = int(match.group(2))
-                    episode = int(match.group(3))
+        # Most names are Show.Name.S01E02; scan those without the regex engine
+        groups = _scan_sxxexx(cleaned)
+        if groups is None:
+            # Try standard patterns in a single scan
+            match = _SHOW_RE.search(cleaned)
+            if not match:
+                self.logger.warning("No pattern matched for filename: %s", filename)
+                return None
+            index = match.lastgroup[1:]
+            groups = match.group(f"show{index}", f"season{index}", f"episode{index}")
 
-                    # Clean up show name
-                    show_name = re.sub(r"\[.*?\]", "", raw_show_name).strip()
-                    show_name = show_name.split("-")[0].strip()
+        try:
+            raw_show_name = groups[0].replace(".", " ").strip()
+            season = int(groups[1])
+            episode = int(groups[2])
 
-                    self.logger.info(
-                        f"Matched: Show='{show_name}', S{season:02d}E{episode:02d}"
-                    )
-                    return show_name, season, episode
+            # Clean up show name
+            show_name = raw_show_name.partition("-")[0].strip()
 
-                except (IndexError, ValueError) as e:
-                    self.logger.error(f"Error parsing filename '{filename}': {e}")
-                    continue
+            self.logger.info(
+                "Matched: Show='%s', S%02dE%02d", show_name, season, episode
+            )
+            return show_name, season, episode
 
-        self.logger.warning(f"No pattern matched for filename: {filename}")
-        return None
+        except (IndexError, ValueError) as e:
+            self.logger.error("Error parsing filename '%s': %s", filename, e)
+            return None
 
     def get_stats(self):
         """Get API and cache statistics"""
@@ -172,19 +305,69 @@ class TVShowRenamer:
             ),
         }
 
+    @staticmethod
+    def _disk_key(kind: str, cache_key) -> str:
+        """Format a memory cache key (a string or tuple) as a disk cache key."""
+        if isinstance(cache_key, tuple):
+            return kind + ":" + ":".join(map(str, cache_key))
+        return f"{kind}:{cache_key}"
+
+    def _get_cached(self, cache: Dict, cache_key, kind: str) -> Optional[Dict]:
+        """Look up memory then disk cache, promoting disk hits into memory."""
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._disk.get(self._disk_key(kind, cache_key))
+            if data is None:
+                self.logger.debug("Cache miss for %s: %s", kind, cache_key)
+                return None
+            with self._lock:
+                cache[cache_key] = data
+
+        with self._lock:
+            self.cache_hits[kind] += 1
+        self._profile.cache_hit = True
+        self.logger.debug("Cache hit for %s: %s", kind, cache_key)
+        return data
+
+    def _store_cached(
+        self, cache: Dict, cache_key, kind: str, data: Dict, ttl: Optional[float]
+    ):
+        """Store data in both the memory and disk caches."""
+        with self._lock:
+            cache[cache_key] = data
+        self._disk.set(self._disk_key(kind, cache_key), data, ttl=ttl)
+
+    def _show_cache_key(self, show_name: str) -> str:
+        """Normalize a show name so 'The Office', 'the.office' and 'The  Office' share one entry.
+
+        A release year stays in the key as a separate field, so 'Doctor Who (2005)'
+        and 'Doctor Who 1963' get distinct entries.
+        """
+        name = show_name.strip()
+        year = None
+        match = _YEAR_SUFFIX_RE.match(name)
+        if match:
+            if match.group("paren"):
+                name, year = match.group("name"), match.group("paren")
+            elif MIN_SHOW_YEAR <= int(match.group("bare")) <= time.localtime().tm_year + 1:
+                name, year = match.group("title"), match.group("bare")
+
+        key = _NORM_RE.sub("", name.lower()) or name.lower()
+        return f"{key}|{year}" if year else key
+
     @measure_performance
-    def get_show_info(self, show_name: str) -> Optional[Dict]:
+    def get_show_info(self, show_name: str, refresh_cache: bool = False) -> Optional[Dict]:
         """Get show information from TMDb with caching."""
-        cache_key = show_name.lower()
-        if cache_key in self.show_cache:
-            self.cache_hits["show"] += 1
-            self.logger.debug(f"Cache hit for show: {show_name}")
-            return self.show_cache[cache_key]
+        cache_key = self._show_cache_key(show_name)
+        if not refresh_cache:
+            show_data = self._get_cached(self.show_cache, cache_key, "show")
+            if show_data is not None:
+                return show_data
 
         try:
-            self.api_call_count["search"] += 1
+            with self._lock:
+                self.api_call_count["search"] += 1
             # Cache miss - fetch from API
-            self.logger.debug(f"Cache miss for show: {show_name}")
             search_results = self.search.tv_shows(term=show_name)
             if not search_results:
                 return None
@@ -202,27 +385,32 @@ class TVShowRenamer:
                     :200
                 ],  # Limit overview length
             }
-            self.show_cache[cache_key] = show_data
+            self._store_cached(
+                self.show_cache, cache_key, "show", show_data, SHOW_CACHE_TTL
+            )
             return show_data
 
         except Exception as e:
-            self.logger.error(f"Error finding show '{show_name}': {str(e)}")
+            self.logger.error("Error finding show '%s': %s", show_name, e)
             return None
 
+    @measure_performance
     def get_episode_info(
-        self, show_id: int, season: int, episode: int
+        self, show_id: int, season: int, episode: int, refresh_cache: bool = False
     ) -> Optional[Dict]:
         """Get episode information from TMDb with caching."""
-        cache_key = f"{show_id}_{season}_{episode}"
-        if cache_key in self.episode_cache:
-            self.cache_hits["episode"] += 1
-            self.logger.debug(f"Cache hit for episode: {cache_key}")
-            return self.episode_cache[cache_key]
+        # Tuple keys hash without building a string; the disk key is only
+        # formatted on a memory miss
+        cache_key = (show_id, season, episode)
+        if not refresh_cache:
+            episode_data = self._get_cached(self.episode_cache, cache_key, "episode")
+            if episode_data is not None:
+                return episode_data
 
         try:
-            self.api_call_count["episode_details"] += 1
+            with self._lock:
+                self.api_call_count["episode_details"] += 1
             # Cache miss - fetch from API
-            self.logger.debug(f"Cache miss for episode: {cache_key}")
             details = self.episode.details(show_id, season, episode)
 
             # Store minimal data in cache
@@ -235,45 +423,77 @@ class TVShowRenamer:
                     :200
                 ],  # Limit overview length
             }
-            self.episode_cache[cache_key] = episode_data
+            self._store_cached(
+                self.episode_cache,
+                cache_key,
+                "episode",
+                episode_data,
+                self._episode_ttl(episode_data),
+            )
             return episode_data
 
         except Exception as e:
-            self.logger.error(f"Error finding episode S{season:02d}E{episode:02d}: {e}")
+            self.logger.error("Error finding episode S%02dE%02d: %s", season, episode, e)
             return None
 
-    def get_season_details(self, show_id: int, season_num: int) -> Optional[Dict]:
+    @staticmethod
+    def _episode_ttl(episode_data: Dict) -> Optional[float]:
+        """Aired episodes are cached forever; unaired ones may still change."""
+        air_date = episode_data.get("air_date")
+        if air_date and air_date <= time.strftime("%Y-%m-%d"):
+            return None
+        return UNAIRED_EPISODE_CACHE_TTL
+
+    @measure_performance
+    def get_season_details(
+        self, show_id: int, season_num: int, refresh_cache: bool = False
+    ) -> Optional[Dict]:
         """Get season details with caching."""
-        cache_key = f"{show_id}_{season_num}"
-        if cache_key in self.season_cache:
-            self.cache_hits["season"] += 1
-            self.logger.debug(f"Cache hit for season: {cache_key}")
-            return self.season_cache[cache_key]
+        cache_key = (show_id, season_num)
+        if not refresh_cache:
+            primed = cache_key in self.season_cache
+            season_data = self._get_cached(self.season_cache, cache_key, "season")
+            if season_data is not None:
+                if not primed:
+                    self._prime_episode_cache(show_id, season_num, season_data)
+                return season_data
 
         try:
-            self.api_call_count["season_details"] += 1
+            with self._lock:
+                self.api_call_count["season_details"] += 1
             # Cache miss - fetch from API
-            self.logger.debug(f"Cache miss for season: {cache_key}")
-            season = self.tv.season(show_id, season_num)
+            season = self.season_api.details(show_id, season_num)
 
-            # Store minimal data in cache
+            # Store minimal data in cache, in the same shape as get_episode_info
             season_data = {
                 "episodes": [
                     {
-                        "episode_number": ep.episode_number,
                         "name": ep.name,
                         "air_date": getattr(ep, "air_date", None),
+                        "episode_number": ep.episode_number,
+                        "season_number": season_num,
+                        "overview": (getattr(ep, "overview", "") or "")[:200],
                     }
                     for ep in season.episodes
                 ]
             }
-            self.season_cache[cache_key] = season_data
+            self._store_cached(
+                self.season_cache, cache_key, "season", season_data, SEASON_CACHE_TTL
+            )
+            self._prime_episode_cache(show_id, season_num, season_data)
             return season_data
 
         except Exception as e:
-            self.logger.error(f"Error getting season details: {e}")
+            self.logger.error("Error getting season details: %s", e)
             return None
 
+    def _prime_episode_cache(self, show_id: int, season_num: int, season_data: Dict):
+        """Seed the episode cache from a season response so single lookups hit it."""
+        with self._lock:
+            for episode_data in season_data["episodes"]:
+                cache_key = (show_id, season_num, episode_data["episode_number"])
+                self.episode_cache.setdefault(cache_key, episode_data)
+
     def generate_new_name(
         self, original_name: str, show_id: int = None
     ) -> Optional[str]:
@@ -294,73 +514,84 @@ class TVShowRenamer:
             if not episode_info:
                 return None
 
-            # Create new filename with consistent casing
-            extension = os.path.splitext(original_name)[1]
-            show_name = format_show_name(show_info[0])
-            episode_name = format_show_name(episode_info["name"])
-            new_name = f"{show_name}-S{season_num:02d}E{episode_num:02d}-{episode_name}{extension}"
-            return self.sanitize_filename(new_name)
+            return self._format_new_name(
+                original_name, show_info[0], season_num, episode_num, episode_info
+            )
 
         except Exception as e:
-            self.logger.error(f"Error getting episode info: {e}")
+            self.logger.error("Error getting episode info: %s", e)
             return None
 
+    def close(self):
+        """Flush and close the disk cache."""
+        self._disk.close()
+
+    def _format_new_name(
+        self,
+        original_name: str,
+        show_title: str,
+        season_num: int,
+        episode_num: int,
+        episode_info: Dict,
+    ) -> str:
+        """Build the sanitized Show-S01E02-Episode.ext filename."""
+        # Create new filename with consistent casing
+        extension = os.path.splitext(original_name)[1]
+        show_name = format_show_name(show_title)
+        episode_name = format_show_name(episode_info["name"])
+        new_name = f"{show_name}-S{season_num:02d}E{episode_num:02d}-{episode_name}{extension}"
+        return self.sanitize_filename(new_name)
+
     def sanitize_filename(self, filename: str) -> str:
         """Remove invalid characters from filename."""
         # Replace invalid characters with underscore
-        invalid_chars = r'[<>:"/\\|?*]'
-        sanitized = re.sub(invalid_chars, "_", filename)
+        sanitized = filename.translate(_INVALID_CHARS_TABLE)
         
         # Clean up multiple spaces and underscore-space combinations
-        sanitized = re.sub(r'_\s+', '_', sanitized)  # Replace underscore followed by spaces with single underscore
-        sanitized = re.sub(r'\s+_', '_', sanitized)  # Replace spaces followed by underscore with single underscore
-        sanitized = re.sub(r'\s+', ' ', sanitized)   # Replace multiple spaces with single space
-        sanitized = re.sub(r'^\s+|\s+$', '', sanitized)  # Remove leading/trailing spaces
+        sanitized = _UNDERSCORE_SPACE_RE.sub("_", sanitized)  # Replace underscore followed by spaces with single underscore
+        sanitized = _SPACE_UNDERSCORE_RE.sub("_", sanitized)  # Replace spaces followed by underscore with single underscore
+        sanitized = _MULTI_SPACE_RE.sub(" ", sanitized)  # Replace multiple spaces with single space
+        sanitized = sanitized.strip()  # Remove leading/trailing spaces
         
         return sanitized
 
-        return re.sub(invalid_chars, "_", filename)
-
     @log_safely
     def extract_episode_number(self, filename: str) -> Optional[int]:
         """Extract episode number from filename."""
-        # Patterns to match episode numbers
-        patterns = [
-            r"_-_(\d{2})(?:_|\(|$)",  # Match _-_01 format specifically
-            r"E(\d{1,2})",  # Match E01, E1, etc.
-            r"^(\d{1,2})[\. _]-",  # Match episode numbers at start (e.g., "01 - ")
-            r"x(\d{1,2})",  # Match 1x01 format
-            r"(\d{2})(?=\D|$)",  # Match two digits followed by non-digit or end
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
+        if not _HAS_DIGIT_RE.search(filename):
+            self.logger.warning("No episode number found in filename: %s", filename)
+            return None
+
+        for pattern in _EPISODE_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 try:
                     episode_num = int(match.group(1))
-                    self.logger.debug(f"Found episode number: {episode_num}")
+                    self.logger.debug("Found episode number: %s", episode_num)
                     return episode_num
                 except (IndexError, ValueError) as e:
-                    self.logger.error(f"Error parsing episode number: {e}")
+                    self.logger.error("Error parsing episode number: %s", e)
                     continue
 
-        self.logger.warning(f"No episode number found in filename: {filename}")
+        self.logger.warning("No episode number found in filename: %s", filename)
         return None
 
     def get_performance_stats(self):
-        """Get performance statistics"""
+        """Get performance statistics (empty unless TVRENAMER_PROFILE is set)"""
         api_times = self.performance_stats["api_times"]
         cache_times = self.performance_stats["cache_times"]
+        total_api_time = sum(api_times) / 1e9
+        total_cache_time = sum(cache_times) / 1e9
 
         return {
             "avg_api_time": (
-                f"{sum(api_times) / len(api_times):.3f}s" if api_times else "N/A"
+                f"{total_api_time / len(api_times):.3f}s" if api_times else "N/A"
             ),
             "avg_cache_time": (
-                f"{sum(cache_times) / len(cache_times):.3f}s" if cache_times else "N/A"
+                f"{total_cache_time / len(cache_times):.3f}s" if cache_times else "N/A"
             ),
-            "total_api_time": f"{sum(api_times):.3f}s",
-            "total_cache_time": f"{sum(cache_times):.3f}s",
+            "total_api_time": f"{total_api_time:.3f}s",
+            "total_cache_time": f"{total_cache_time:.3f}s",
             "api_calls_count": len(api_times),
             "cache_hits_count": len(cache_times),
         }
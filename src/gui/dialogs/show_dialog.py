@@ -1,19 +1,95 @@
 import tkinter as tk
 from tkinter import ttk
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from tmdbv3api import TMDb, TV, Season
 from dotenv import load_dotenv
 import os
-from src.utils.logger import setup_logger, log_safely, format_show_name
+from src.core.models.tmdb_show import TMDbShow
+from src.utils.logger import (
+    setup_logger,
+    log_safely,
+    sanitize_log_message,
+    format_show_name,
+)
+from src.utils.tmdb_session import get_tmdb_session
+
+
+# Shared TMDb clients, set up once on first import rather than per dialog
+load_dotenv()
+_TMDB = TMDb(session=get_tmdb_session())
+# The setter stores str(key) in os.environ, so assigning a missing key would
+# leave the literal "None" there for every later TMDb client
+if os.getenv("TMDB_API_KEY"):
+    _TMDB.api_key = os.getenv("TMDB_API_KEY")
+# tmdbv3api's response cache bypasses the session (and its keep-alive);
+# responses are cached by the helpers below instead
+_TMDB.cache = False
+_TV = TV()
+_SEASON = Season()
+
+# TMDb accepts at most this many resources in one append_to_response
+TMDB_MAX_APPEND = 20
+# Episodes shown per page; long-running shows can list hundreds per season
+EPISODE_PAGE_SIZE = 100
+
+
+# TMDb responses shared across dialog instances. tmdbv3api reads the API key
+# from a process-wide setting, so the key is part of each cache key.
+@lru_cache(maxsize=128)
+def _cached_search(api_key, query):
+    # Only keep the first 10 shows for better performance
+    return tuple(
+        TMDbShow.from_tmdb(show) for show in islice(_TV.search(query, page=1), 10)
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_tv_details(api_key, show_id):
+    # Only number_of_seasons is needed; skip the default videos/images/credits
+    return _TV.details(show_id, append_to_response="")
+
+
+@lru_cache(maxsize=64)
+def _cached_season_batch(api_key, show_id, first, last):
+    """Fetch seasons first..last of a show in a single request"""
+    seasons = range(first, last + 1)
+    details = _TV.details(
+        show_id, append_to_response=",".join(f"season/{n}" for n in seasons)
+    )
+    return {n: getattr(details, f"season/{n}", None) for n in seasons}
+
+
+@lru_cache(maxsize=256)
+def _cached_season_details(api_key, show_id, season_num):
+    return _SEASON.details(show_id, season_num)
+
+
+def _season_from_batch(batch, season_num):
+    """Return a future for one season that resolves when its batch request does"""
+    future = Future()
+
+    def resolve(done):
+        error = done.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(done.result().get(season_num))
+
+    batch.add_done_callback(resolve)
+    return future
 
 
 class ShowInputDialog:
     def __init__(self, parent):
-        # Initialize TMDb
-        load_dotenv()
-        self.tmdb = TMDb()
-        self.tmdb.api_key = os.getenv("TMDB_API_KEY")
-        self.tv = TV()
-        self.season_api = Season()
+        self.tmdb = _TMDB
+        if not self.tmdb.api_key:
+            raise ValueError("TMDB_API_KEY not found in environment variables")
+        self.tv = _TV
+        self.season_api = _SEASON
         self.logger = setup_logger(__name__)
 
         # Create dialog window
@@ -30,11 +106,31 @@ class ShowInputDialog:
         self.selected_show = None
         self.selected_season = None
         self.selected_episode = None
-        self.shows_dict = {}
-        self.seasons_dict = {}
-        self.episodes_dict = {}
+        # Row-aligned with the listboxes: the item at index i backs row i
+        self._shows = []
+        self._seasons = []
+        self._episodes = []
+        # All episodes of the selected season; _episodes holds the current page
+        self._episodes_all = []
+        self._episode_page = 0
+
+        # TMDb requests run on worker threads; their results are applied by
+        # _poll_results on the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="show-dialog")
+        self._results = queue.Queue()
+        self._request_seq = {"search": 0, "seasons": 0, "episodes": 0}
+        self._poll_id = None
+        # Pending debounced search, and the query the shown results belong to
+        self._search_after_id = None
+        self._last_query = None
+        # Text currently in the info box; the widget starts out empty
+        self._last_info = ""
+        # (show_id, season_num) -> Future of the season details request
+        self._season_cache = {}
 
         self.create_widgets()
+        self.dialog.bind("<Destroy>", self._on_destroy)
+        self._poll_results()
 
     def center_window(self):
         self.dialog.update_idletasks()
@@ -57,8 +153,10 @@ class ShowInputDialog:
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 10))
 
-        search_btn = ttk.Button(search_frame, text="Search", command=self.search_shows)
-        search_btn.pack(side=tk.RIGHT)
+        self.search_btn = ttk.Button(
+            search_frame, text="Search", command=self.schedule_search
+        )
+        self.search_btn.pack(side=tk.RIGHT)
 
         # Create a frame for lists with equal column weights
         lists_frame = ttk.Frame(main_container)
@@ -74,7 +172,12 @@ class ShowInputDialog:
         shows_frame = ttk.Frame(lists_frame)
         shows_frame.grid(row=1, column=0, sticky="nsew", padx=5)
 
-        self.shows_list = tk.Listbox(shows_frame, exportselection=0)
+        # Each list is backed by a StringVar so it can be cleared or filled
+        # with one assignment (one redraw) instead of per-row Tcl calls
+        self._shows_var = tk.StringVar(value=())
+        self.shows_list = tk.Listbox(
+            shows_frame, listvariable=self._shows_var, exportselection=0
+        )
         shows_scroll = ttk.Scrollbar(shows_frame, orient="vertical", command=self.shows_list.yview)
         self.shows_list.configure(yscrollcommand=shows_scroll.set)
         shows_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -85,7 +188,10 @@ class ShowInputDialog:
         seasons_frame = ttk.Frame(lists_frame)
         seasons_frame.grid(row=1, column=1, sticky="nsew", padx=5)
 
-        self.seasons_list = tk.Listbox(seasons_frame, exportselection=0)
+        self._seasons_var = tk.StringVar(value=())
+        self.seasons_list = tk.Listbox(
+            seasons_frame, listvariable=self._seasons_var, exportselection=0
+        )
         seasons_scroll = ttk.Scrollbar(seasons_frame, orient="vertical", command=self.seasons_list.yview)
         self.seasons_list.configure(yscrollcommand=seasons_scroll.set)
         seasons_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -96,12 +202,31 @@ class ShowInputDialog:
         episodes_frame = ttk.Frame(lists_frame)
         episodes_frame.grid(row=1, column=2, sticky="nsew", padx=5)
 
-        self.episodes_list = tk.Listbox(episodes_frame, exportselection=0)
+        self._episodes_var = tk.StringVar(value=())
+        self.episodes_list = tk.Listbox(
+            episodes_frame, listvariable=self._episodes_var, exportselection=0
+        )
         episodes_scroll = ttk.Scrollbar(episodes_frame, orient="vertical", command=self.episodes_list.yview)
         self.episodes_list.configure(yscrollcommand=episodes_scroll.set)
         episodes_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.episodes_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        # Episode pagination
+        pager_frame = ttk.Frame(lists_frame)
+        pager_frame.grid(row=2, column=2, sticky="ew", padx=5, pady=(5, 0))
+
+        self.prev_page_btn = ttk.Button(
+            pager_frame, text="<< Prev", command=lambda: self.show_episode_page(self._episode_page - 1)
+        )
+        self.prev_page_btn.pack(side=tk.LEFT)
+        self.next_page_btn = ttk.Button(
+            pager_frame, text="Next >>", command=lambda: self.show_episode_page(self._episode_page + 1)
+        )
+        self.next_page_btn.pack(side=tk.RIGHT)
+        self.episode_page_var = tk.StringVar()
+        ttk.Label(pager_frame, textvariable=self.episode_page_var).pack(expand=True)
+        self.update_pager()
+
         # Show info frame
         info_frame = ttk.LabelFrame(main_container, text="Show Information", padding="5")
         info_frame.pack(fill=tk.X, pady=10)
@@ -118,7 +243,7 @@ class ShowInputDialog:
         ttk.Button(buttons_frame, text="Cancel", command=self.dialog.destroy).pack(side=tk.RIGHT)
 
         # Bind events with proper event handling
-        self.search_entry.bind("<Return>", lambda e: self.search_shows())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_search())
         self.shows_list.bind("<<ListboxSelect>>", self.on_show_select)
         self.seasons_list.bind("<<ListboxSelect>>", self.on_season_select)
         self.episodes_list.bind("<<ListboxSelect>>", self.on_episode_select)
@@ -126,90 +251,174 @@ class ShowInputDialog:
         # Set focus to search entry
         self.search_entry.focus_set()
 
+    def _run_in_background(self, kind, func, callback, *args):
+        """Run func(*args) on the worker pool and pass its future to callback on the Tk thread.
+
+        Only the latest request of each kind is applied; older results are dropped.
+        """
+        self._deliver(kind, self._executor.submit(func, *args), callback)
+
+    def _deliver(self, kind, future, callback):
+        """Queue callback(future) for the Tk thread once future completes"""
+        self._request_seq[kind] += 1
+        seq = self._request_seq[kind]
+        future.add_done_callback(
+            lambda f: self._results.put((kind, seq, callback, f))
+        )
+
+    def _season_future(self, show_id, season_num):
+        """Return the (possibly still running) season details request, starting it if needed"""
+        key = (show_id, season_num)
+        future = self._season_cache.get(key)
+        if future is None or (future.done() and future.exception() is not None):
+            future = self._executor.submit(
+                _cached_season_details, self.tmdb.api_key, show_id, season_num
+            )
+            self._season_cache[key] = future
+        return future
+
+    def _prefetch_seasons(self, show_id, number_of_seasons):
+        """Request every season of a show up front so season clicks need no network.
+
+        Seasons are appended to show detail requests, TMDB_MAX_APPEND at a time.
+        """
+        for first in range(1, number_of_seasons + 1, TMDB_MAX_APPEND):
+            last = min(first + TMDB_MAX_APPEND - 1, number_of_seasons)
+            if all((show_id, n) in self._season_cache for n in range(first, last + 1)):
+                continue
+
+            batch = self._executor.submit(
+                _cached_season_batch, self.tmdb.api_key, show_id, first, last
+            )
+            for season_num in range(first, last + 1):
+                self._season_cache.setdefault(
+                    (show_id, season_num), _season_from_batch(batch, season_num)
+                )
+
+    def _cancel_pending(self, *kinds):
+        """Discard results of in-flight requests whose lists were just cleared"""
+        for kind in kinds:
+            self._request_seq[kind] += 1
+
+    def _poll_results(self):
+        """Apply finished background requests; Tk widgets are only touched here"""
+        try:
+            while True:
+                kind, seq, callback, future = self._results.get_nowait()
+                if seq == self._request_seq[kind]:
+                    callback(future)
+        except queue.Empty:
+            pass
+        self._poll_id = self.dialog.after(50, self._poll_results)
+
+    def _on_destroy(self, event):
+        if event.widget is not self.dialog:
+            return
+        # Stop queued rows and results from touching destroyed widgets
+        self._cancel_pending("search", "seasons", "episodes")
+        if self._poll_id:
+            self.dialog.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._search_after_id:
+            self.dialog.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._executor.shutdown(wait=False)
+
+    def schedule_search(self):
+        """Search 250 ms after the last keystroke or click, collapsing bursts into one request"""
+        if self._search_after_id:
+            self.dialog.after_cancel(self._search_after_id)
+        self._search_after_id = self.dialog.after(250, self.search_shows)
+
     def search_shows(self):
-        query = self.search_var.get().strip()
+        self._search_after_id = None
+        query = " ".join(self.search_var.get().lower().split())
         if not query:
             return
+        # Keys that don't change the text (arrows, Return) keep the current results
+        if query == self._last_query and self._shows:
+            return
+        self._last_query = query
 
-        self.shows_list.delete(0, tk.END)
-        self.seasons_list.delete(0, tk.END)
-        self.episodes_list.delete(0, tk.END)
-        self.shows_dict.clear()
-        self.seasons_dict.clear()
-        self.episodes_dict.clear()
+        self.clear_lists("shows")
         self.update_info("")
 
+        self.search_btn.state(["disabled"])
+        self._run_in_background(
+            "search", _cached_search, self._on_search_done, self.tmdb.api_key, query
+        )
+
+    def _on_search_done(self, future):
+        self.search_btn.state(["!disabled"])
         try:
-            # Get search results with pagination and limit
-            page = 1
-            shows = self.tv.search(query, page=page)
-            
-            # Only process first 10 shows for better performance
-            for i, show in enumerate(shows):
-                if i >= 10:  # Limit to first 10 results
-                    break
-                    
-                # Only store essential data
-                show_data = {
-                    'id': show.id,
-                    'name': show.name,
-                    'first_air_date': getattr(show, 'first_air_date', 'N/A'),
-                    'overview': getattr(show, 'overview', '')[:200]  # Limit overview length
-                }
-                
-                show_name = format_show_name(show_data['name'])
-                year = show_data['first_air_date'][:4] if show_data['first_air_date'] != 'N/A' else 'N/A'
-                display_text = f"{show_name} ({year})"
-                
-                self.shows_list.insert(tk.END, display_text)
-                self.shows_dict[display_text] = show  # Keep original show object for compatibility
-                
+            shows = future.result()
         except Exception as e:
             self.logger.error(f"Error searching shows: {str(e)}")
             self.shows_list.insert(tk.END, f"Error: {str(e)}")
+            return
 
-    def on_show_select(self, event):
-        selection = self.shows_list.curselection()
-        if not selection:
+        # Add rows one idle slot at a time so the first match paints right away
+        seq = self._request_seq["search"]
+        for show in shows:
+            self.dialog.after_idle(self._append_show_row, seq, show)
+
+    def _append_show_row(self, seq, show):
+        """Format and insert one search result, unless a newer search replaced it"""
+        if seq != self._request_seq["search"]:
             return
+        show_name = format_show_name(show.name)
+        year = show.first_air_date[:4] if show.first_air_date != 'N/A' else 'N/A'
+        self.shows_list.insert(tk.END, f"{show_name} ({year})")
+        self._shows.append(show)
+
+    @staticmethod
+    def _selected(listbox, items):
+        """Return the item behind the listbox's selected row, or None"""
+        selection = listbox.curselection()
+        # Status rows such as "Error: ..." have no backing item
+        if selection and selection[0] < len(items):
+            return items[selection[0]]
+        return None
 
-        display_text = self.shows_list.get(selection[0])
-        show = self.shows_dict.get(display_text)
+    def on_show_select(self, event):
+        show = self._selected(self.shows_list, self._shows)
         if not show:
             return
 
         # Update show info using object attributes
         info_text = (f"Title: {show.name}\n"
-                    f"First Aired: {show.first_air_date if hasattr(show, 'first_air_date') else 'N/A'}\n"
-                    f"Overview: {show.overview[:200] if hasattr(show, 'overview') else ''}")
+                    f"First Aired: {show.first_air_date}\n"
+                    f"Overview: {show.overview}")
         self.update_info(info_text)
 
         # Load seasons using show object
         self.load_seasons(show)
 
     def load_seasons(self, show):
-        self.seasons_list.delete(0, tk.END)
-        self.seasons_dict.clear()
-
+        self.clear_lists("seasons")
+
+        # Access show.id directly
+        self._run_in_background(
+            "seasons",
+            _cached_tv_details,
+            self._on_seasons_loaded,
+            self.tmdb.api_key,
+            show.id,
+        )
+
+    def _on_seasons_loaded(self, future):
         try:
-            # Access show.id directly
-            details = self.tv.details(show.id)
-            for season in range(1, details.number_of_seasons + 1):
-                display_text = f"Season {season}"
-                self.seasons_list.insert(tk.END, display_text)
-                self.seasons_dict[display_text] = season
+            details = future.result()
+            self._seasons = list(range(1, details.number_of_seasons + 1))
+            self._seasons_var.set(tuple(f"Season {season}" for season in self._seasons))
+            self._prefetch_seasons(details.id, details.number_of_seasons)
         except Exception as e:
             self.logger.error(f"Error loading seasons: {str(e)}")
             self.seasons_list.insert(tk.END, f"Error: {str(e)}")
 
     def on_season_select(self, event):
-        show_selection = self.shows_list.curselection()
-        season_selection = self.seasons_list.curselection()
-        if not show_selection or not season_selection:
-            return
-
-        show = self.shows_dict.get(self.shows_list.get(show_selection[0]))
-        season_num = self.seasons_dict.get(self.seasons_list.get(season_selection[0]))
+        show = self._selected(self.shows_list, self._shows)
+        season_num = self._selected(self.seasons_list, self._seasons)
 
         if show and season_num:
             self.selected_season = season_num
@@ -217,53 +426,109 @@ class ShowInputDialog:
 
     def load_episodes(self, show, season_num):
         """Load episodes for the selected season"""
-        self.episodes_list.delete(0, tk.END)
-        self.episodes_dict.clear()
+        self.clear_lists("episodes")
+
+        # Usually already fetched (or in flight) from the season prefetch
+        self._deliver(
+            "episodes",
+            self._season_future(show.id, season_num),
+            self._on_episodes_loaded,
+        )
 
+    def _on_episodes_loaded(self, future):
         try:
-            # Access show.id directly
-            season_details = self.season_api.details(show.id, season_num)
-            if not season_details or not hasattr(season_details, 'episodes'):
+            season_details = future.result()
+            episodes = getattr(season_details, 'episodes', None)
+            if not episodes:
                 self.episodes_list.insert(tk.END, "No episodes found")
                 return
 
-            # Sort and display episodes
-            episodes = sorted(season_details.episodes, key=lambda x: x.episode_number)
-
-            for episode in episodes:
-                episode_name = format_show_name(episode.name)
-                air_date = f" ({episode.air_date})" if hasattr(episode, 'air_date') else ""
-                display_text = f"E{episode.episode_number:02d} - {episode_name}{air_date}"
-                
-                self.episodes_list.insert(tk.END, display_text)
-                self.episodes_dict[display_text] = episode
+            # TMDb already orders episodes, so this is a single linear pass;
+            # it only guards against an out-of-order payload
+            self._episodes_all = sorted(episodes, key=attrgetter("episode_number"))
+            self.show_episode_page(0)
 
         except Exception as e:
             error_msg = f"Error loading episodes: {str(e)}"
             self.logger.error(error_msg)
             self.episodes_list.insert(tk.END, error_msg)
 
-    def on_episode_select(self, event):
-        selection = self.episodes_list.curselection()
-        if not selection:
-            return
+    def clear_lists(self, first):
+        """Empty the `first` list and every list that depends on it.
+
+        Lists cascade shows -> seasons -> episodes; results still in flight
+        for a cleared list are discarded.
+        """
+        if first == "shows":
+            self._shows_var.set(())
+            self._shows = []
+            self._cancel_pending("search")
+        if first in ("shows", "seasons"):
+            self._seasons_var.set(())
+            self._seasons = []
+            self._cancel_pending("seasons")
+
+        self._episodes_var.set(())
+        self._episodes = []
+        self._episodes_all = []
+        self._episode_page = 0
+        self._cancel_pending("episodes")
+        self.update_pager()
+
+    def show_episode_page(self, page):
+        """Display one page of the loaded episodes; only that page's rows exist in the Listbox"""
+        page_count = self._episode_page_count()
+        page = max(0, min(page, page_count - 1))
+        start = page * EPISODE_PAGE_SIZE
+
+        self._episode_page = page
+        self._episodes = self._episodes_all[start:start + EPISODE_PAGE_SIZE]
+
+        display_texts = []
+        for episode in self._episodes:
+            episode_name = format_show_name(episode.name)
+            air_date = getattr(episode, 'air_date', None)
+            air_date = f" ({air_date})" if air_date else ""
+            display_texts.append(
+                f"E{episode.episode_number:02d} - {episode_name}{air_date}"
+            )
+
+        self._episodes_var.set(tuple(display_texts))
+        self.update_pager()
+
+    def _episode_page_count(self):
+        return max(1, -(-len(self._episodes_all) // EPISODE_PAGE_SIZE))
 
-        display_text = self.episodes_list.get(selection[0])
-        episode = self.episodes_dict.get(display_text)
+    def update_pager(self):
+        page_count = self._episode_page_count()
+        self.episode_page_var.set(f"Page {self._episode_page + 1}/{page_count}")
+        self.prev_page_btn.state(["!disabled" if self._episode_page > 0 else "disabled"])
+        self.next_page_btn.state(
+            ["!disabled" if self._episode_page < page_count - 1 else "disabled"]
+        )
+
+    def on_episode_select(self, event):
+        episode = self._selected(self.episodes_list, self._episodes)
 
         if episode:
             self.selected_episode = episode
 
             # Update info text with episode details
-            if hasattr(episode, 'overview') and episode.overview:
+            overview = getattr(episode, 'overview', '') or ''
+            if overview:
                 episode_info = (
                     f"Episode: {episode.name}\n"
-                    f"Air Date: {episode.air_date if hasattr(episode, 'air_date') else 'N/A'}\n"
-                    f"Overview: {episode.overview[:200]}..."
+                    f"Air Date: {getattr(episode, 'air_date', 'N/A')}\n"
+                    f"Overview: {overview[:200]}..."
                 )
                 self.update_info(episode_info)
 
     def update_info(self, text):
+        # Re-clicking a row must not clear and redraw identical text
+        if text == self._last_info:
+            return
+        self._last_info = text
+
         self.info_text.config(state=tk.NORMAL)
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(tk.END, text)
@@ -271,33 +536,20 @@ class ShowInputDialog:
 
     def select_show(self):
         """Handle show selection and dialog closure"""
-        show_selection = self.shows_list.curselection()
-        if not show_selection:
-            return
-
-        display_text = self.shows_list.get(show_selection[0])
-        show_data = self.shows_dict.get(display_text)
+        show = self._selected(self.shows_list, self._shows)
         
-        if show_data:
-            # Convert dictionary back to TMDb show object
-            self.selected_show = type('TMDbShow', (), {
-                'id': show_data['id'],
-                'name': show_data['name'],
-                'first_air_date': show_data['first_air_date'],
-                'overview': show_data['overview']
-            })
+        if show:
+            self.selected_show = show
 
             # Get selected season
-            season_selection = self.seasons_list.curselection()
-            if season_selection:
-                season_text = self.seasons_list.get(season_selection[0])
-                self.selected_season = self.seasons_dict.get(season_text)
+            season_num = self._selected(self.seasons_list, self._seasons)
+            if season_num:
+                self.selected_season = season_num
 
                 # Get selected episode
-                episode_selection = self.episodes_list.curselection()
-                if episode_selection:
-                    episode_text = self.episodes_list.get(episode_selection[0])
-                    self.selected_episode = self.episodes_dict.get(episode_text)
+                episode = self._selected(self.episodes_list, self._episodes)
+                if episode:
+                    self.selected_episode = episode
 
             self.dialog.destroy()
 
@@ -308,18 +560,21 @@ class ShowInputDialog:
     def get_season_details(self, show_id, season_num):
         """Get detailed information about a specific season"""
         try:
-            # Use the TV class to get season details
-            season = self.tv.season(show_id, season_num)
+            # Shares the dialog's season cache; blocks until the request completes
+            season = self._season_future(show_id, season_num).result()
             if not season:
-                print(f"No season found for show {show_id}, season {season_num}")
+                self.logger.warning(
+                    "No season found for show %s, season %s", show_id, season_num
+                )
                 return None
 
-            # Add debug information
-            print(
-                f"Season data received: {season.__dict__ if hasattr(season, '__dict__') else 'No details'}"
-            )
+            # Lazy %-formatting: the payload is only rendered when DEBUG is enabled
+            self.logger.debug("Season data received: %r", getattr(season, "__dict__", None))
             return season
 
         except Exception as e:
-            print(f"Error getting season details: {e}")
+            # Request errors can embed the URL (and API key); no traceback
+            self.logger.error(
+                "Error getting season details: %s", sanitize_log_message(str(e))
+            )
             return None
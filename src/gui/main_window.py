@@ -1,19 +1,19 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-from pathlib import Path
 import json
 import re
-from typing import List, Dict, Optional
-from datetime import datetime
-from src.core.renamer import TVShowRenamer
-from src.gui.dialogs.show_dialog import ShowInputDialog
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from src.utils.disk_cache import DEFAULT_CACHE_DIR
 from src.utils.logger import setup_logger, log_safely
 import time
-import threading
 import queue
+import threading
 from src.core.models.file_entry import FileEntry
 from src.core.models.renaming_method import RenamingMethod
+from src.core.models.undo_batch import UndoBatch
 from src.gui.widgets.file_list import FileListManager
 
 # Try to import drag and drop support
@@ -26,6 +26,64 @@ except (ImportError, RuntimeError) as e:
     print(f"Drag and drop support not available: {e}")
     print("Using basic file selection instead.")
 
+# Renames release the GIL, so slow (network) filesystems benefit from overlap
+MAX_RENAME_WORKERS = 16
+# Number of batches kept (in memory and on disk) for undo
+UNDO_LOG_SIZE = 50
+# Adds larger than this are inserted into the file list in chunks
+LARGE_ADD_SIZE = 1000
+# Rows kept in the undo history view
+HISTORY_SIZE = 10
+# Shared pool for background tasks and concurrent TMDb preview lookups
+BACKGROUND_WORKERS = 8
+# Episode lookups remembered for the selected show
+EPISODE_CACHE_SIZE = 2048
+# Result polling interval bounds (ms); backs off while the worker is idle
+POLL_MIN_MS = 50
+POLL_MAX_MS = 500
+# Bursts of preview/stats refresh requests within this window (ms) run once
+REFRESH_DEBOUNCE_MS = 150
+# One dropped path: "{path with spaces}" or a bare run of non-space characters
+_DND_TOKEN = re.compile(r"\{([^}]*)\}|(\S+)")
+
+
+def _safe_rename(old_path: str, new_path: str) -> Tuple[str, str]:
+    """Rename a file, returning (status, resulting path) instead of raising"""
+    try:
+        os.rename(old_path, new_path)
+        return "Success", new_path
+    except Exception as e:
+        return f"Error: {str(e)}", old_path
+
+
+def _target_taken(old_path: str, new_path: str) -> bool:
+    """True if new_path is an existing file other than old_path itself.
+
+    A case-only rename on a case-insensitive filesystem sees its own file.
+    """
+    if not os.path.lexists(new_path):
+        return False
+    try:
+        return not os.path.samefile(old_path, new_path)
+    except OSError:
+        return True
+
+
+def _safe_undo(path: str, original_name: str) -> Tuple[str, str]:
+    """Rename a file back to original_name, returning (status, resulting path).
+
+    A missing file is reported as "Skipped"; os.replace's own ENOENT replaces
+    a separate exists() check.
+    """
+    original_path = os.path.join(os.path.dirname(path), original_name)
+    try:
+        os.replace(path, original_path)
+        return "Success", original_path
+    except FileNotFoundError:
+        return "Skipped", path
+    except OSError as e:
+        return f"Error: {str(e)}", path
+
 
 class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
     def __init__(self):
@@ -44,12 +102,37 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
 
         # Initialize variables
         self.files: List[FileEntry] = []
-        self.undo_stack: List[Dict] = []
+        self._entries_by_iid: Dict[str, FileEntry] = {}
+        # (original name, show id, season) each row was last previewed as "Ready" with
+        self._preview_fp: Dict[str, Tuple] = {}
+        self.undo_stack = deque(maxlen=UNDO_LOG_SIZE)
+        self._undo_log = os.path.join(DEFAULT_CACHE_DIR, "undo_log.jsonl")
+        self._load_undo_log()
+        # Undo history rows, newest first, mirroring history_list
+        self._history_items = deque()
         self.current_method: Optional[RenamingMethod] = None
-        self.tv_renamer = TVShowRenamer(self)
+
+        # Name generators per renaming method, called as generator(file_entry, index).
+        # The TV show method maps to None and goes through the TMDb lookup path.
+        self._name_generators = {
+            "TV Show (TVDB)": None,
+            "<Inc Nr>": lambda fe, i: f"{i:03d}{fe.ext}",
+            "<Name>": lambda fe, i: fe.original_name,
+            "<Ext>": lambda fe, i: f"{fe.stem}{fe.ext.lower()}",
+            "<Date>": self._gen_date_name,
+        }
+        self._active_generator = None
+        # Filled by load_renaming_methods, keyed by method tree item id
+        self._method_by_iid: Dict[str, RenamingMethod] = {}
+        # Created on first TV show lookup; TMDb setup is not needed to open the window
+        self.tv_renamer = None
+        # Found episodes by (show id, season, episode); misses are not kept
+        self._episode_memo: Dict[Tuple[int, int, int], Dict] = {}
+        self._episode_lock = threading.Lock()
         self.current_show = None
         self.current_season = None
         self.current_episode = None
+        self._name_prefix = ""
         self.show_info_var = tk.StringVar()
         self.show_info_var.set("No show selected")
 
@@ -67,16 +150,26 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
         self.response_time_var = tk.StringVar(value="Avg Response: 0ms")
         self.cache_rate_var = tk.StringVar(value="Cache Rate: 0%")
 
-        # Add queue for background processing
-        self.task_queue = queue.Queue()
-        self.result_queue = queue.Queue()
-        self.processing = False
+        # Background tasks and preview lookups; threads are started on first use
+        self.pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS)
 
-        # Start background worker
-        self.start_background_worker()
+        # Finished background tasks, handed back to the Tk thread by check_results
+        self.result_queue = queue.SimpleQueue()
+        # True while a batch rename runs; closing then would lose its undo record
+        self.processing = False
+        self._poll_ms = POLL_MIN_MS
+        self._poll_id = None
+        # Bumped per preview so late results from a superseded one are dropped
+        self._preview_seq = 0
+        self._preview_outstanding = 0
+        # Pending debounced refreshes (Tk after ids)
+        self._pending_preview = None
+        self._pending_stats = None
 
         self.setup_ui()
         self.load_renaming_methods()
+        self._poll_id = self.after(self._poll_ms, self.check_results)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def setup_ui(self):
         # Configure weight for root window
@@ -97,6 +190,9 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
         ttk.Button(self.toolbar, text="Add Files", command=self.add_files).pack(
             side=tk.LEFT, padx=2
         )
+        ttk.Button(self.toolbar, text="Add Folder", command=self.add_folder).pack(
+            side=tk.LEFT, padx=2
+        )
         ttk.Button(self.toolbar, text="Clear", command=self.clear_files).pack(
             side=tk.LEFT, padx=2
         )
@@ -242,127 +338,295 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
         ]
 
         for method in methods:
-            self.method_tree.insert(
+            iid = self.method_tree.insert(
                 "", "end", text=method.name, values=(method.description,)
             )
+            self._method_by_iid[iid] = method
 
     def add_files(self):
         files = filedialog.askopenfilenames()
         self.process_new_files(files)
 
+    def add_folder(self):
+        """Add every file in a folder, reusing the stat data from the directory scan"""
+        folder = filedialog.askdirectory()
+        if not folder:
+            return
+
+        try:
+            with os.scandir(folder) as it:
+                entries = [
+                    FileEntry(dir_entry.path, stat_result=dir_entry.stat())
+                    for dir_entry in it
+                    if dir_entry.is_file() and not dir_entry.name.startswith(".")
+                ]
+        except OSError as e:
+            messagebox.showerror("Add Folder", f"Could not read folder: {e}")
+            return
+
+        entries.sort(key=lambda entry: entry.original_name.lower())
+        self.add_entries(entries)
+
     def process_new_files(self, files: tuple):
         """Process new files and update UI"""
+        entries = []
         for file_path in files:
-            entry = FileEntry(file_path)
-            self.file_list.add_file(
-                entry.original_name,
-                entry.path,
-                status="Not processed",
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                stat_result = None
+            entries.append(FileEntry(file_path, stat_result=stat_result))
+        self.add_entries(entries)
+
+    def add_entries(self, entries: List[FileEntry]):
+        """Add file entries to the list and refresh the preview"""
+        # Keep each entry in step with its row so update_preview can diff them
+        for entry in entries:
+            entry.status = "Not processed"
+        rows = [(entry.original_name, entry.new_name, entry.path, entry.status) for entry in entries]
+
+        # Very large drops go in a chunk at a time so the window keeps repainting;
+        # each chunk is registered as soon as its rows are visible. Smaller adds
+        # queue behind one still loading so self.files keeps the tree's order.
+        if len(rows) > LARGE_ADD_SIZE or self.file_list.inserting:
+            self.file_list.add_rows_batched(
+                rows,
+                on_chunk=lambda start, item_ids: self._register_entries(
+                    entries[start:start + len(item_ids)], item_ids
+                ),
             )
+        else:
+            self._register_entries(entries, self.file_list.add_rows(rows))
+
+    def _register_entries(self, entries: List[FileEntry], item_ids: List[str]):
+        """Link entries to their new rows and refresh the preview"""
+        for entry, item_id in zip(entries, item_ids):
+            entry.tree_iid = item_id
+            self._entries_by_iid[item_id] = entry
+        self.files.extend(entries)
         self.update_drop_zone()
         # Trigger preview update when files are added
-        self.update_preview()
+        self.schedule_preview()
 
     def clear_files(self):
         """Clear file list and show drop zone"""
         self.file_list.clear()
+        self.files.clear()
+        self._entries_by_iid.clear()
+        self._preview_fp.clear()
         self.update_drop_zone()
 
     def on_method_select(self, event):
         selection = self.method_tree.selection()
         if selection:
-            item = self.method_tree.item(selection[0])
-            method_name = item["text"]
-            # Find the corresponding method
-            for method in [m for m in self.method_tree.get_children()]:
-                if self.method_tree.item(method)["text"] == method_name:
-                    self.current_method = RenamingMethod(
-                        method_name,
-                        self.method_tree.item(method)["text"],
-                        self.method_tree.item(method)["values"][0],
-                    )
-                    self.update_preview()
-                    break
+            self.current_method = self._method_by_iid[selection[0]]
+            self._active_generator = self._name_generators.get(self.current_method.name)
+            self.schedule_preview()
+
+    def _gen_date_name(self, file_entry: FileEntry, index: int) -> str:
+        """Name a file after its creation date, numbered to keep names unique."""
+        if file_entry.ctime is None:
+            return ""
+        date_str = time.strftime("%Y-%m-%d", time.localtime(file_entry.ctime))
+        return f"{date_str}_{index:03d}{file_entry.ext}"
+
+    def get_tv_renamer(self):
+        """Return the TMDb-backed renamer, creating it on first use"""
+        if self.tv_renamer is None:
+            from src.core.renamer import TVShowRenamer
+
+            self.tv_renamer = TVShowRenamer(self)
+        return self.tv_renamer
+
+    def _episode_info(self, show_id: int, season: int, episode: int) -> Optional[Dict]:
+        """Memoized tv_renamer.get_episode_info; safe to call from pool threads.
+
+        get_episode_info returns None both for a missing episode and for a
+        failed request, so only real results are remembered and a retry can
+        still succeed.
+        """
+        key = (show_id, season, episode)
+        with self._episode_lock:
+            info = self._episode_memo.get(key)
+        if info is not None:
+            return info
+
+        info = self.get_tv_renamer().get_episode_info(show_id, season, episode)
+        if info is not None:
+            with self._episode_lock:
+                if len(self._episode_memo) >= EPISODE_CACHE_SIZE:
+                    # Evict the oldest lookup
+                    del self._episode_memo[next(iter(self._episode_memo))]
+                self._episode_memo[key] = info
+        return info
 
     @log_safely
     def preview_tv_show_rename(self, file_entry: FileEntry):
         """Preview TV show rename using TMDb."""
+        file_entry.new_name, file_entry.status = self._resolve_episode(file_entry)
+
+        # Update stats after API calls
+        self.schedule_stats()
+
+    def _resolve_episode(self, file_entry: FileEntry) -> Tuple[str, str]:
+        """Work out (new name, status) for a file from TMDb.
+
+        Makes no Tk calls, so it can run on the preview pool.
+        """
         if not self.current_show:
-            file_entry.status = "No show selected"
-            file_entry.new_name = ""
-            return
+            return "", "No show selected"
 
         if not self.current_season:
-            file_entry.status = "No season selected"
-            file_entry.new_name = ""
-            return
+            return "", "No season selected"
 
         try:
-            # Extract episode number from filename
-            show_info = self.tv_renamer.extract_episode_number(file_entry.original_name)
-            if not show_info:
-                file_entry.status = "No episode number found"
-                file_entry.new_name = ""
-                return
-
-            episode_num = show_info
+            tv_renamer = self.get_tv_renamer()
 
-            # Use the selected season and episode number
-            try:
-                # Get episode information from TMDb
-                episode_info = self.tv_renamer.get_episode_info(
-                    self.current_show.id, self.current_season, episode_num
-                )
+            # Extract episode number from filename
+            episode_num = tv_renamer.extract_episode_number(file_entry.original_name)
+            if not episode_num:
+                return "", "No episode number found"
 
-                if episode_info:
-                    # Create new filename
-                    extension = os.path.splitext(file_entry.original_name)[1]
-                    new_name = (
-                        f"{self.current_show.name}-S{self.current_season:02d}E{episode_num:02d}-"
-                        f"{episode_info['name']}{extension}"
-                    )
-                    file_entry.new_name = self.tv_renamer.sanitize_filename(new_name)
-                    file_entry.status = "Ready"
-                else:
-                    file_entry.status = (
-                        f"Episode not found in season {self.current_season}"
-                    )
-                    file_entry.new_name = ""
+            # Get episode information from TMDb
+            episode_info = self._episode_info(
+                self.current_show.id, self.current_season, episode_num
+            )
+            if not episode_info:
+                return "", f"Episode not found in season {self.current_season}"
 
-            except Exception as e:
-                file_entry.status = f"Error: {str(e)}"
-                file_entry.new_name = ""
+            # Create new filename
+            new_name = f"{self._name_prefix}{episode_num:02d}-{episode_info['name']}{file_entry.ext}"
+            return tv_renamer.sanitize_filename(new_name), "Ready"
 
         except Exception as e:
-            file_entry.status = f"Error: {str(e)}"
-            file_entry.new_name = ""
-
-        # Update stats after API calls
-        self.update_stats()
+            return "", f"Error: {str(e)}"
 
     def update_preview(self):
         """Update the preview based on selected method."""
         # Don't clear the file list - just update existing entries
-        if not self.file_list.tree.get_children():
+        if not self.files:
             return
 
-        # Process files in batch
-        for item in self.file_list.tree.get_children():
-            values = self.file_list.tree.item(item)["values"]
-            file_path = values[2]  # Get path from treeview
-            
-            # Create FileEntry from existing item
-            file_entry = FileEntry(file_path)
-            file_entry.original_name = values[0]  # Preserve original name
-            
-            # Process the preview
-            self.preview_tv_show_rename(file_entry)
-            
-            # Update the item in treeview
-            self.file_list.update_item(item, original_name=file_entry.original_name, new_name=file_entry.new_name, path=file_entry.path, status=file_entry.status)
-            
-            # Force update of the UI
+        # Results from an earlier preview still in flight are discarded
+        self._preview_seq += 1
+        seq = self._preview_seq
+        self._preview_outstanding = 0
+
+        generator = self._active_generator
+        if generator is not None:
+            # Generated names replace any TMDb preview
+            self._preview_fp.clear()
+            refresh_row = self._refresh_row
+            with self.file_list.batch_update():
+                for index, file_entry in enumerate(self.files, start=1):
+                    previous = (file_entry.new_name, file_entry.status)
+                    file_entry.new_name = generator(file_entry, index)
+                    file_entry.status = "Ready" if file_entry.new_name else "No name generated"
+                    refresh_row(file_entry, previous)
             self.update_idletasks()
+            return
+
+        # Skip rows already previewed for this show and season
+        show_id = getattr(self.current_show, "id", None)
+        season = self.current_season
+        preview_fp = self._preview_fp
+        entries = []
+        fingerprints = []
+        for file_entry in self.files:
+            fp = (file_entry.original_name, show_id, season)
+            if preview_fp.get(file_entry.tree_iid) != fp:
+                entries.append(file_entry)
+                fingerprints.append(fp)
+        if not entries:
+            return
+
+        # Fetch the whole season once, on the pool, so per-file episode
+        # lookups queued behind it hit the cache
+        prefetch = None
+        if self.current_show and self.current_season:
+            try:
+                tv_renamer = self.get_tv_renamer()
+                prefetch = self.pool.submit(
+                    tv_renamer.get_season_details, show_id, season
+                )
+            except Exception as e:
+                self.logger.error(f"Error prefetching season: {e}")
+
+        # Resolve episodes on the pool; each row is patched on the Tk thread
+        # by check_results as its lookup finishes
+        self._preview_outstanding = len(entries)
+        for file_entry, fp in zip(entries, fingerprints):
+            self.process_in_background(
+                self._resolve_after,
+                prefetch,
+                file_entry,
+                on_done=lambda result, e=file_entry, fp=fp: self._apply_preview(
+                    seq, e, fp, result
+                ),
+            )
+
+    def _resolve_after(self, prefetch, file_entry: FileEntry) -> Tuple[str, str]:
+        """Wait for the season prefetch, then resolve one file; runs on the pool"""
+        if prefetch is not None:
+            try:
+                prefetch.result()
+            except Exception as e:
+                self.logger.error(f"Error prefetching season: {e}")
+        return self._resolve_episode(file_entry)
+
+    def _apply_preview(self, seq: int, file_entry: FileEntry, fp, result: Tuple[str, str]):
+        """Show one resolved preview, unless a newer preview has started"""
+        if seq != self._preview_seq:
+            return
+        self._preview_outstanding -= 1
+        if file_entry.tree_iid not in self._entries_by_iid:
+            return
+
+        previous = (file_entry.new_name, file_entry.status)
+        file_entry.new_name, file_entry.status = result
+        self._refresh_row(file_entry, previous)
+        if file_entry.status == "Ready":
+            self._preview_fp[file_entry.tree_iid] = fp
+        else:
+            self._preview_fp.pop(file_entry.tree_iid, None)
+
+        if not self._preview_outstanding:
+            self.schedule_stats()
+
+    def schedule_preview(self):
+        """Run update_preview once events stop arriving for a moment"""
+        if self._pending_preview is not None:
+            self.after_cancel(self._pending_preview)
+        self._pending_preview = self.after(REFRESH_DEBOUNCE_MS, self._run_preview)
+
+    def _run_preview(self):
+        self._pending_preview = None
+        self.update_preview()
+
+    def flush_preview(self):
+        """Run a scheduled preview now, so callers see up-to-date names"""
+        if self._pending_preview is not None:
+            self.after_cancel(self._pending_preview)
+            self._run_preview()
+
+    def schedule_stats(self):
+        """Run update_stats once events stop arriving for a moment"""
+        if self._pending_stats is not None:
+            self.after_cancel(self._pending_stats)
+        self._pending_stats = self.after(REFRESH_DEBOUNCE_MS, self._run_stats)
+
+    def _run_stats(self):
+        self._pending_stats = None
+        self.update_stats()
+
+    def _refresh_row(self, file_entry: FileEntry, previous):
+        """Push an entry's new name and status to its row if either changed"""
+        if (file_entry.new_name, file_entry.status) != previous:
+            self.file_list.update_item(
+                file_entry.tree_iid,
+                new_name=file_entry.new_name,
+                status=file_entry.status,
+            )
 
     def process_batch(self, files):
         """Process multiple files with progress updates"""
@@ -370,36 +634,43 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
         processed = 0
         failed = []
         retry_count = 3  # Number of retries for failed API calls
+        # Touch the progress widgets about a hundred times per batch at most
+        progress_step = max(1, total_files // 100)
+
+        # Bind what the loop calls per file to locals
+        set_progress = self.progress_var.set
+        set_label = self.progress_label.config
+        preview = self.preview_tv_show_rename
+        logger = self.logger
 
         for file_entry in files:
             try:
                 # Update progress
                 processed += 1
-                progress = (processed / total_files) * 100
-                self.progress_var.set(progress)
-                self.progress_label.config(text=f"Processing {processed}/{total_files}")
-                self.update_idletasks()
+                if processed % progress_step == 0 or processed == total_files:
+                    set_progress((processed / total_files) * 100)
+                    set_label(text=f"Processing {processed}/{total_files}")
 
                 # Process file with retries
                 for attempt in range(retry_count):
                     try:
-                        self.preview_tv_show_rename(file_entry)
+                        preview(file_entry)
                         break
                     except Exception as e:
                         if attempt == retry_count - 1:
                             failed.append((file_entry, str(e)))
-                            self.logger.error(
+                            logger.error(
                                 f"Failed to process {file_entry.original_name} after {retry_count} attempts: {e}"
                             )
                         else:
-                            self.logger.warning(
+                            logger.warning(
                                 f"Attempt {attempt + 1} failed for {file_entry.original_name}: {e}. Retrying..."
                             )
                             time.sleep(1)  # Wait before retry
 
             except Exception as e:
                 failed.append((file_entry, str(e)))
-                self.logger.error(f"Error processing {file_entry.original_name}: {e}")
+                logger.error(f"Error processing {file_entry.original_name}: {e}")
 
         # Show summary of failures if any
         if failed:
@@ -415,12 +686,7 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
 
     def start_batch(self):
         """Execute the batch renaming operation."""
-        files = [
-            FileEntry(self.file_list.tree.item(item)["values"][2])  # Create FileEntry from path
-            for item in self.file_list.tree.get_children()
-        ]
-        
-        if not files:
+        if not self.files:
             messagebox.showwarning("No Files", "Please add files to rename first.")
             return
 
@@ -428,39 +694,131 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
             messagebox.showwarning("No Method", "Please select a renaming method first.")
             return
 
-        # Store current state for undo
-        undo_batch = {
-            "timestamp": datetime.now().isoformat(),
-            "files": []
-        }
+        # Rename from the latest preview, not one still waiting to run
+        self.flush_preview()
+        if self._preview_outstanding:
+            messagebox.showinfo(
+                "Preview Running", "Please wait for the preview to finish."
+            )
+            return
 
-        success_count = 0
-        for item in self.file_list.tree.get_children():
-            values = self.file_list.tree.item(item)["values"]
-            original_name = values[0]
-            new_name = values[1]
-            current_path = values[2]
+        pending = []
+        for file_entry in self.files:
+            new_name = file_entry.new_name
+            current_path = file_entry.path
             
             if not new_name or new_name == "Not processed":
                 continue
+            new_path = os.path.join(file_entry.directory, new_name)
+            if new_path == current_path:
+                continue
 
-            try:
-                new_path = os.path.join(os.path.dirname(current_path), new_name)
-                os.rename(current_path, new_path)
-                
-                # Store original state for undo
-                undo_batch["files"].append((new_path, original_name))
-                
-                # Update status in treeview
-                self.file_list.update_item(item, new_name=new_name, path=new_path, status="Success")
-                success_count += 1
-                
-            except Exception as e:
-                self.file_list.update_item(item, new_name=new_name, path=current_path, status=f"Error: {str(e)}")
+            pending.append((file_entry, current_path, new_path))
 
-        if undo_batch["files"]:
-            self.undo_stack.append(undo_batch)
-            
+        # Rename on the background worker; results come back through check_results
+        self._set_processing(True)
+        self.process_in_background(
+            self._do_renames,
+            pending,
+            on_done=lambda results: self._finish_batch(pending, results),
+            # Nothing reaches _finish_batch if the task itself fails
+            on_error=lambda error: self._set_processing(False),
+        )
+
+    @staticmethod
+    def _do_renames(pending) -> List[Tuple[str, str]]:
+        """Perform a batch's renames; runs off the Tk thread
+
+        Independent renames run in parallel. Rows whose new name is another
+        row's current name run one at a time, each after that file has moved
+        away. Rows that share a new name, or whose new name is a file outside
+        the batch, are rejected rather than overwriting it.
+        """
+        if not pending:
+            return []
+        results: List[Optional[Tuple[str, str]]] = [None] * len(pending)
+        targets = [os.path.normcase(new_path) for _, _, new_path in pending]
+        target_counts = Counter(targets)
+        # Row index by the normalized path of every file not yet renamed
+        unmoved = {os.path.normcase(old_path): i for i, (_, old_path, _) in enumerate(pending)}
+
+        parallel, serial = [], []
+        for i, (_, old_path, new_path) in enumerate(pending):
+            if target_counts[targets[i]] > 1:
+                results[i] = ("Error: Another file in this batch gets the same name", old_path)
+            elif unmoved.get(targets[i], i) != i or os.path.lexists(new_path):
+                serial.append(i)
+            else:
+                parallel.append(i)
+
+        def rename(i: int) -> Tuple[str, str]:
+            return _safe_rename(pending[i][1], pending[i][2])
+
+        if parallel:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_RENAME_WORKERS, len(parallel))
+            ) as executor:
+                for i, result in zip(parallel, executor.map(rename, parallel)):
+                    results[i] = result
+                    if result[0] == "Success":
+                        del unmoved[os.path.normcase(pending[i][1])]
+
+        # Chains like A->B, B->C go in whatever order frees each target first
+        while serial:
+            blocked = []
+            for i in serial:
+                if unmoved.get(targets[i], i) != i:
+                    blocked.append(i)
+                    continue
+                # os.rename would silently replace it on POSIX
+                if _target_taken(pending[i][1], pending[i][2]):
+                    results[i] = ("Error: Target exists", pending[i][1])
+                    continue
+                results[i] = rename(i)
+                if results[i][0] == "Success":
+                    del unmoved[os.path.normcase(pending[i][1])]
+            if len(blocked) == len(serial):
+                # A cycle, or a file whose own rename failed
+                for i in blocked:
+                    results[i] = (
+                        "Error: New name is still taken by another file in this batch",
+                        pending[i][1],
+                    )
+                break
+            serial = blocked
+
+        return results
+
+    def _finish_batch(self, pending, results: List[Tuple[str, str]]):
+        """Apply a finished batch's results on the Tk thread in a single pass"""
+        # Store current state for undo
+        undo_batch = UndoBatch(time.time(), [], [])
+
+        success_count = 0
+        failed_statuses = {}
+        with self.file_list.batch_update():
+            for (file_entry, _, new_path), (status, result_path) in zip(pending, results):
+                file_entry.status = status
+                if status == "Success":
+                    # Store original state for undo
+                    undo_batch.add(new_path, file_entry.original_name)
+                    file_entry.path = result_path
+                    success_count += 1
+                # The list may have been cleared while the batch was running
+                if file_entry.tree_iid not in self._entries_by_iid:
+                    continue
+                if status == "Success":
+                    self.file_list.update_item(file_entry.tree_iid, path=result_path, status=status)
+                else:
+                    self._preview_fp.pop(file_entry.tree_iid, None)
+                    failed_statuses[file_entry.path] = status
+            # Failed rows keep their path, so only their status changes
+            self.file_list.update_file_statuses(failed_statuses)
+
+        if undo_batch:
+            self.push_undo_batch(undo_batch)
+
+        self._set_processing(False)
         messagebox.showinfo(
             "Batch Complete",
             f"Successfully renamed {success_count} files."
@@ -472,28 +830,43 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
             return
 
         last_batch = self.undo_stack.pop()
+        self._save_undo_log()
 
-        for file_path, original_name in last_batch["files"]:
-            try:
-                current_dir = os.path.dirname(file_path)
-                new_path = os.path.join(current_dir, original_name)
-                if os.path.exists(file_path):
-                    os.rename(file_path, new_path)
-            except Exception as e:
-                messagebox.showerror("Undo Error", f"Error undoing rename: {str(e)}")
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_RENAME_WORKERS, len(last_batch)))
+        ) as executor:
+            results = list(executor.map(_safe_undo, last_batch.paths, last_batch.names))
+
+        errors = [status for status, _ in results if status.startswith("Error")]
+        if errors:
+            messagebox.showerror(
+                "Undo Error", "Error undoing rename:\n" + "\n".join(errors[:10])
+            )
 
         self.clear_files()
         messagebox.showinfo("Undo Complete", "Successfully undid last batch rename.")
 
     def open_show_dialog(self):
-        dialog = ShowInputDialog(self)
+        from src.gui.dialogs.show_dialog import ShowInputDialog
+
+        try:
+            dialog = ShowInputDialog(self)
+        except ValueError as e:
+            messagebox.showerror("TV Show Search", str(e))
+            return
         result = dialog.get_result()
         if result:
             show, season, episode = result
             if show:
+                # Episode lookups belong to the previous show
+                with self._episode_lock:
+                    self._episode_memo.clear()
+                self._preview_fp.clear()
                 self.current_show = show
                 self.current_season = season
                 self.current_episode = episode
+                # The "<show>-SxxE" part of every TV preview name for this selection
+                self._name_prefix = f"{show.name}-S{season:02d}E" if season else ""
 
                 # Update the show info display with season and episode
                 season_info = f" - Season {season}" if season else ""
@@ -509,17 +882,17 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
                 )
 
                 # If TV Show method is not selected, select it
-                for item in self.method_tree.get_children():
-                    if self.method_tree.item(item)["text"] == "TV Show (TVDB)":
+                for item, method in self._method_by_iid.items():
+                    if method.name == "TV Show (TVDB)":
                         self.method_tree.selection_set(item)
                         self.on_method_select(None)  # Trigger method selection
                         break
 
                 # Update the preview with new show/season information
-                self.update_preview()
+                self.schedule_preview()
 
         # Update stats after dialog closes
-        self.update_stats()
+        self.schedule_stats()
 
     def handle_drop(self, event):
         """Handle dropped files"""
@@ -547,38 +920,18 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
             List of cleaned file paths
         """
         self.logger.debug(f"Parsing drop data: {data}")
-        files = []
 
         try:
             if not isinstance(data, str):
                 return list(data)
 
-            # Handle Windows-style paths
-            if os.name == "nt":
-                # Split by '} {' and clean up the braces
-                paths = data.split("} {")
-                files = [p.strip("{}") for p in paths]
-
-            # Handle macOS/Linux paths
-            else:
-                # Handle paths with spaces and special characters
-                if data.startswith("{") and data.endswith("}"):
-                    # Multiple files are separated by spaces within braces
-                    paths = data[1:-1].split("} {")
-                    files = [p.strip("{}") for p in paths]
-                else:
-                    # Single file or space-separated paths
-                    files = data.split()
-
-            # Clean up paths
-            cleaned_files = []
-            for file_path in files:
-                # Remove any escape characters
-                cleaned_path = file_path.replace("\\", "")
-                # Remove any remaining braces
-                cleaned_path = cleaned_path.strip("{}")
-                # Add to cleaned files list
-                cleaned_files.append(cleaned_path)
+            # Tk wraps paths containing spaces in braces and separates paths
+            # with spaces; one scan handles both, on every platform
+            cleaned_files = [
+                braced or bare
+                for braced, bare in _DND_TOKEN.findall(data.replace("\\", ""))
+                if braced or bare
+            ]
 
             self.logger.debug(f"Parsed files: {cleaned_files}")
             return cleaned_files
@@ -589,13 +942,16 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
 
     def update_drop_zone(self):
         """Update drop zone visibility based on file list content"""
-        if len(self.file_list.tree.get_children()) == 0:
+        if not self.files:
             self.drop_label.place(relx=0.5, rely=0.5, anchor="center")
         else:
             self.drop_label.place_forget()
 
     def update_stats(self):
         """Update the statistics display"""
+        if self.tv_renamer is None:
+            return
+
         try:
             stats = self.tv_renamer.get_stats()
             perf_stats = self.tv_renamer.get_performance_stats()
@@ -617,42 +973,71 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
         except Exception as e:
             self.logger.error(f"Error updating stats: {e}")
 
-    def start_background_worker(self):
-        """Start background worker thread"""
-
-        def worker():
-            while True:
-                task = self.task_queue.get()
-                if task is None:
-                    break
-                try:
-                    result = task()
-                    self.result_queue.put(("success", result))
-                except Exception as e:
-                    self.result_queue.put(("error", str(e)))
-                self.task_queue.task_done()
-
-        self.worker_thread = threading.Thread(target=worker, daemon=True)
-        self.worker_thread.start()
-        self.after(100, self.check_results)
+    def _set_processing(self, processing: bool):
+        """Mark a batch rename as running or finished and toggle Start Batch"""
+        self.processing = processing
+        self.start_batch_btn.configure(state="disabled" if processing else "normal")
+
+    def _on_close(self):
+        """Stop timers and let the background pool wind down before closing"""
+        # Renames finishing after the window is gone would never be logged for undo
+        if self.processing:
+            messagebox.showinfo(
+                "Batch Running", "Please wait for the batch rename to finish before closing."
+            )
+            return
+        for after_id in (self._poll_id, self._pending_preview, self._pending_stats):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        # Close the window right away; submitted tasks finish before exit
+        self.pool.shutdown(wait=False)
+        if self.tv_renamer is not None:
+            self.tv_renamer.close()
+        self.destroy()
+
+    def _on_bg_done(self, future, on_done, on_error):
+        """Queue a finished task's outcome for check_results; runs on a pool thread"""
+        try:
+            self.result_queue.put(("success", future.result(), on_done))
+        except Exception as e:
+            self.result_queue.put(("error", str(e), on_error))
 
     def check_results(self):
-        """Check for completed background tasks"""
+        """Check for completed background tasks, polling less often while idle"""
+        drained = False
         try:
             while True:
-                status, result = self.result_queue.get_nowait()
+                status, result, callback = self.result_queue.get_nowait()
+                drained = True
                 if status == "error":
                     self.logger.error(f"Background task error: {result}")
                     messagebox.showerror("Error", f"Background task failed: {result}")
-                self.result_queue.task_done()
+                if callback is not None:
+                    callback(result)
         except queue.Empty:
             pass
         finally:
-            self.after(100, self.check_results)
+            if drained:
+                self._poll_ms = POLL_MIN_MS
+            else:
+                self._poll_ms = min(self._poll_ms * 2, POLL_MAX_MS)
+            self._poll_id = self.after(self._poll_ms, self.check_results)
 
-    def process_in_background(self, func, *args, **kwargs):
-        """Queue a task for background processing"""
-        self.task_queue.put(lambda: func(*args, **kwargs))
+    def process_in_background(self, func, *args, on_done=None, on_error=None, **kwargs):
+        """Queue a task for background processing.
+
+        on_done, if given, is called with the task's result on the Tk thread;
+        on_error, if given, with the error message after it has been shown.
+        """
+        future = self.pool.submit(func, *args, **kwargs)
+        future.add_done_callback(lambda f: self._on_bg_done(f, on_done, on_error))
+
+        # Poll at full rate again so the result is picked up promptly
+        if self._poll_ms > POLL_MIN_MS:
+            self._poll_ms = POLL_MIN_MS
+            if self._poll_id is not None:
+                self.after_cancel(self._poll_id)
+            self._poll_id = self.after(self._poll_ms, self.check_results)
 
     def sort_treeview(self, col):
         """Sort treeview by column."""
@@ -691,51 +1076,96 @@ class AdvancedRenamer(TkinterDnD.Tk if DRAG_DROP_SUPPORTED else tk.Tk):
             return
 
         # Store undo information
-        undo_batch = {
-            "timestamp": datetime.now().isoformat(),
-            "files": []
-        }
+        undo_batch = UndoBatch(time.time(), [], [])
 
+        errors = []
         for item in selected:
-            values = self.file_list.tree.item(item)["values"]
-            original_name = values[0]
-            current_path = values[2]
-            
-            try:
-                # Get original path
-                original_path = os.path.join(
-                    os.path.dirname(current_path),
-                    original_name
-                )
-                
-                # Perform undo
-                if os.path.exists(current_path):
-                    os.rename(current_path, original_path)
-                    undo_batch["files"].append((current_path, original_name))
-                    
-                    # Update treeview
-                    self.file_list.update_item(item, new_name="", path=original_path, status="Undone")
-            
-            except Exception as e:
-                self.logger.error(f"Error undoing rename: {e}")
-                self.file_list.update_item(item, new_name="", path=current_path, status=f"Undo failed: {str(e)}")
+            file_entry = self._entries_by_iid[item]
+            current_path = file_entry.path
+
+            # Perform undo
+            status, original_path = _safe_undo(current_path, file_entry.original_name)
+            if status == "Success":
+                undo_batch.add(current_path, file_entry.original_name)
+
+                # Keep the entry in step with the treeview
+                self._preview_fp.pop(item, None)
+                file_entry.path = original_path
+                file_entry.new_name = ""
+                file_entry.status = "Undone"
+
+                # Update treeview
+                self.file_list.update_item(item, new_name="", path=original_path, status="Undone")
+            elif status != "Skipped":
+                reason = status.partition("Error: ")[2]
+                self.logger.error(f"Error undoing rename: {reason}")
+                errors.append(f"{file_entry.original_name}: {reason}")
+                self.file_list.update_item(item, new_name="", path=current_path, status=f"Undo failed: {reason}")
 
         # Add to undo history
-        if undo_batch["files"]:
+        if undo_batch:
             self.add_to_history(undo_batch)
 
-    def add_to_history(self, batch):
+        # One dialog for all failures, after every rename has been attempted
+        if errors:
+            messagebox.showerror(
+                "Undo Error", "Error undoing rename:\n" + "\n".join(errors[:10])
+            )
+
+    def push_undo_batch(self, batch: UndoBatch):
+        """Record a batch for undo and append it to the on-disk log"""
+        self.undo_stack.append(batch)
+        try:
+            os.makedirs(os.path.dirname(self._undo_log), exist_ok=True)
+            with open(self._undo_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(batch.to_dict()) + "\n")
+        except OSError as e:
+            self.logger.error(f"Error writing undo log: {e}")
+
+    def _load_undo_log(self):
+        """Restore the most recent undo batches saved by earlier sessions"""
+        line_count = 0
+        try:
+            with open(self._undo_log, encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        self.undo_stack.append(UndoBatch.from_dict(json.loads(line)))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.error(f"Error reading undo log: {e}")
+            return
+
+        # Drop batches that fell out of the window so the log stays bounded
+        if line_count > len(self.undo_stack):
+            self._save_undo_log()
+
+    def _save_undo_log(self):
+        """Rewrite the on-disk log from the in-memory undo stack"""
+        try:
+            os.makedirs(os.path.dirname(self._undo_log), exist_ok=True)
+            with open(self._undo_log, "w", encoding="utf-8") as f:
+                for batch in self.undo_stack:
+                    f.write(json.dumps(batch.to_dict()) + "\n")
+        except OSError as e:
+            self.logger.error(f"Error writing undo log: {e}")
+
+    def add_to_history(self, batch: UndoBatch):
         """Add batch operation to history."""
-        time_str = datetime.fromisoformat(batch["timestamp"]).strftime("%H:%M:%S")
-        files_count = len(batch["files"])
+        time_str = time.strftime("%H:%M:%S", time.localtime(batch.timestamp))
+        files_count = len(batch)
 
-        self.history_list.insert(
+        item = self.history_list.insert(
             "", 0, values=(time_str, f"{files_count} files", "Undone")
         )
+        self._history_items.appendleft(item)
 
         # Limit history items
-        if len(self.history_list.get_children()) > 10:
-            self.history_list.delete(self.history_list.get_children()[-1])
+        if len(self._history_items) > HISTORY_SIZE:
+            self.history_list.delete(self._history_items.pop())
 
     def on_file_selection_change(self, selected_files):
         """Handle file selection changes"""
@@ -1,14 +1,40 @@
 import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
 from tkinter import ttk
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import os
+import re
+
+from src.core.models.file_entry import FileEntry
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def _natural_key(text: str) -> List:
+    """Sort key that orders embedded numbers numerically ("E2" before "E10")."""
+    # Splitting on a capture group alternates text and digit runs, so
+    # positions line up between keys and ints only meet ints.
+    parts = _DIGITS_RE.split(str(text).lower())
+    parts[1::2] = [int(digits) for digits in parts[1::2]]
+    return parts
+
 
 class FileListManager(ttk.Frame):
     """Manages and displays a list of files with sorting and undo capabilities."""
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
+        # Row values by item id, kept in step with the tree to avoid Tcl reads
+        self._values: Dict[str, List[str]] = {}
+        # Item id by path, for update_file_status
+        self._path_to_item: Dict[str, str] = {}
+        # Ascending item order per column; dropped whenever rows change
+        self._sort_cache: Dict[str, List[str]] = {}
+        # Chunked inserts waiting to finish, and the Tk after id of the next chunk
+        self._insert_jobs = deque()
+        self._pending_insert = None
         self.sort_state: Dict[str, bool] = {
             "Original Name": False,
             "New Name": False,
@@ -58,23 +84,103 @@ class FileListManager(ttk.Frame):
 
     def add_file(self, original_name: str, path: str, new_name: str = "", status: str = "Not processed") -> str:
         """Add a single file to the list."""
-        item_id = self.tree.insert("", "end", values=(original_name, new_name, path, status))
+        values = [original_name, new_name, path, status]
+        item_id = self.tree.insert("", "end", values=values)
+        self._values[item_id] = values
+        self._path_to_item[path] = item_id
+        self._sort_cache.clear()
         return item_id
 
     def add_files(self, files: List[Tuple[str, str]]):
         """Add multiple files to the list."""
-        for original_name, path in files:
-            self.add_file(original_name, path)
+        self.add_rows([(original_name, "", path, "Not processed") for original_name, path in files])
+
+    def add_rows(self, rows: List[Tuple[str, str, str, str]]) -> List[str]:
+        """Insert (original name, new name, path, status) rows in one pass.
+
+        The tree is taken off the grid while inserting so Tk lays it out once.
+        """
+        self.tree.grid_remove()
+        try:
+            return self._insert_rows(rows)
+        finally:
+            self.tree.grid()
+
+    @property
+    def inserting(self) -> bool:
+        """True while add_rows_batched still has rows waiting to go in."""
+        return bool(self._insert_jobs)
+
+    def add_rows_batched(
+        self, rows: List[Tuple[str, str, str, str]], chunk: int = 200, on_done=None, on_chunk=None
+    ):
+        """Chunked form of add_rows. Calls made while rows are still going in
+        are queued behind them, so each on_done sees only its own item ids.
+
+        on_chunk, if given, is called as on_chunk(start, item_ids) right after
+        rows[start:start + len(item_ids)] are inserted, before Tk gets control back.
+        """
+        self._insert_jobs.append((rows, chunk, [], on_done, on_chunk))
+        if self._pending_insert is None:
+            self._insert_next_chunk(0)
+
+    def _insert_next_chunk(self, start: int):
+        rows, chunk, item_ids, on_done, on_chunk = self._insert_jobs[0]
+        with self.batch_update():
+            chunk_ids = self._insert_rows(rows[start:start + chunk])
+        item_ids.extend(chunk_ids)
+        if on_chunk is not None:
+            on_chunk(start, chunk_ids)
+
+        if start + chunk < len(rows):
+            self._pending_insert = self.after(0, self._insert_next_chunk, start + chunk)
+            return
+
+        self._insert_jobs.popleft()
+        if self._insert_jobs:
+            self._pending_insert = self.after(0, self._insert_next_chunk, 0)
+        else:
+            self._pending_insert = None
+        if on_done is not None:
+            on_done(item_ids)
+
+    def _insert_rows(self, rows) -> List[str]:
+        insert = self.tree.insert
+        values_by_id = self._values
+        path_to_item = self._path_to_item
+        self._sort_cache.clear()
+        item_ids = []
+        for row in rows:
+            values = list(row)
+            item_id = insert("", "end", values=values)
+            values_by_id[item_id] = values
+            path_to_item[values[2]] = item_id
+            item_ids.append(item_id)
+        return item_ids
+
+    def _cancel_pending_insert(self):
+        self._insert_jobs.clear()
+        if self._pending_insert is not None:
+            self.after_cancel(self._pending_insert)
+            self._pending_insert = None
 
     def clear(self):
         """Clear all items from the list."""
+        self._cancel_pending_insert()
         self.tree.delete(*self.tree.get_children())
+        self._values.clear()
+        self._path_to_item.clear()
+        self._sort_cache.clear()
+
+    def get_values(self, item_id: str) -> List[str]:
+        """Return an item's (original name, new name, path, status) values."""
+        return self._values[item_id]
 
     def get_selected_items(self) -> List[Dict[str, str]]:
         """Get information about selected items."""
         selected = []
         for item_id in self.tree.selection():
-            values = self.tree.item(item_id)["values"]
+            values = self._values[item_id]
             selected.append({
                 "id": item_id,
                 "original_name": values[0],
@@ -84,27 +190,69 @@ class FileListManager(ttk.Frame):
             })
         return selected
 
+    def get_selected_files(self) -> List[FileEntry]:
+        """Build FileEntry objects for the selected rows from the cached values."""
+        selected = []
+        for item_id in self.tree.selection():
+            original_name, new_name, path, status = self._values[item_id]
+            file_entry = FileEntry(path, new_name=new_name)
+            file_entry.status = status
+            file_entry.tree_iid = item_id
+            selected.append(file_entry)
+        return selected
+
     def update_item(self, item_id: str, **kwargs):
         """Update specific fields of an item."""
-        current_values = list(self.tree.item(item_id)["values"])
+        current_values = self._values[item_id]
+        previous = list(current_values)
         if "original_name" in kwargs:
             current_values[0] = kwargs["original_name"]
         if "new_name" in kwargs:
             current_values[1] = kwargs["new_name"]
         if "path" in kwargs:
+            if self._path_to_item.get(current_values[2]) == item_id:
+                del self._path_to_item[current_values[2]]
             current_values[2] = kwargs["path"]
+            self._path_to_item[current_values[2]] = item_id
         if "status" in kwargs:
             current_values[3] = kwargs["status"]
-        self.tree.item(item_id, values=current_values)
+
+        # The cached values are authoritative, so unchanged rows skip Tcl entirely
+        if current_values != previous:
+            self._sort_cache.clear()
+            self.tree.item(item_id, values=current_values)
+
+    @contextmanager
+    def batch_update(self):
+        """Hide the columns while many rows change so Tk redraws them once."""
+        display_columns = self.tree["displaycolumns"]
+        self.tree.configure(displaycolumns=())
+        try:
+            yield self
+        finally:
+            self.tree.configure(displaycolumns=display_columns)
 
     def sort_by_column(self, col: str):
         """Sort items by the specified column."""
-        items = [(self.tree.set(item, col), item) for item in self.tree.get_children("")]
-        items.sort(reverse=self.sort_state[col])
-        
-        for index, (_, item) in enumerate(items):
-            self.tree.move(item, "", index)
-        
+        order = self._sort_cache.get(col)
+        if order is None:
+            column = self.tree["columns"].index(col)
+            values = self._values
+            order = sorted(
+                self.tree.get_children(""),
+                key=lambda item: _natural_key(values[item][column]),
+            )
+            self._sort_cache[col] = order
+        items = reversed(order) if self.sort_state[col] else order
+
+        # Off the grid, Tk lays the tree out once instead of after every move
+        self.tree.grid_remove()
+        try:
+            for index, item in enumerate(items):
+                self.tree.move(item, "", index)
+        finally:
+            self.tree.grid()
+
         self.sort_state[col] = not self.sort_state[col]
         self.tree.heading(col, text=f"{col} {'↓' if self.sort_state[col] else '↑'}")
 
@@ -123,7 +271,7 @@ class FileListManager(ttk.Frame):
         """Get information about all items in the list."""
         items = []
         for item_id in self.tree.get_children():
-            values = self.tree.item(item_id)["values"]
+            values = self._values[item_id]
             items.append({
                 "id": item_id,
                 "original_name": values[0],
@@ -135,12 +283,28 @@ class FileListManager(ttk.Frame):
         
     def update_file_status(self, file_path: str, new_status: str):
         """Update the status of a file in the list."""
-        for item in self.tree.get_children():
-            if self.tree.item(item)["values"][2] == file_path:
-                values = list(self.tree.item(item)["values"])
-                values[3] = new_status
-                self.tree.item(item, values=values)
-                break
+        item = self._path_to_item.get(file_path)
+        if item is not None:
+            values = self._values[item]
+            values[3] = new_status
+            self._sort_cache.clear()
+            self.tree.item(item, values=values)
+
+    def update_file_statuses(self, statuses: Dict[str, str]):
+        """Update the status of many files, keyed by path, in one redraw."""
+        changed = []
+        for file_path, new_status in statuses.items():
+            item = self._path_to_item.get(file_path)
+            if item is not None and self._values[item][3] != new_status:
+                self._values[item][3] = new_status
+                changed.append(item)
+        if not changed:
+            return
+
+        self._sort_cache.clear()
+        with self.batch_update():
+            for item in changed:
+                self.tree.item(item, values=self._values[item])
         
     def _on_select(self, event):
         """Handle selection change event."""
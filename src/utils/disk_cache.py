@@ -0,0 +1,142 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from src.utils.logger import setup_logger
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tv_show_renamer")
+# Expired entries are swept on close at most this often (seconds)
+PRUNE_INTERVAL = 24 * 60 * 60
+
+
+class DiskCache:
+    """Persistent cache of JSON values backed by sqlite3, with optional per-entry TTL.
+
+    Values are stored as JSON text, never pickled, so a tampered cache file
+    cannot run code when it is read.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, name: str = "tmdb"):
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._db = None
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Autocommit: every write is its own small transaction, and sqlite
+            # locking keeps several running instances from corrupting the file
+            db = sqlite3.connect(
+                os.path.join(directory, f"{name}.sqlite3"),
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)"
+                )
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)"
+                )
+            except Exception:
+                db.close()
+                raise
+            self._db = db
+            atexit.register(self.close)
+        except Exception as e:
+            self.logger.warning(f"Disk cache disabled: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            # Checked under the lock: close() may run while lookups are in flight
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                value, expires_at = row
+                if expires_at is not None and expires_at < time.time():
+                    # Drop it now rather than re-reading a dead entry next run
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+            except Exception as e:
+                self.logger.error(f"Error reading disk cache: {e}")
+                return None
+
+        try:
+            return json.loads(value)
+        except Exception as e:
+            self.logger.error(f"Error reading disk cache: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a JSON-serializable value under key; entries without a ttl never expire."""
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            data = json.dumps(value, separators=(",", ":"))
+            with self._lock:
+                if self._db is None:
+                    return
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, data, expires_at),
+                )
+        except Exception as e:
+            self.logger.error(f"Error writing disk cache: {e}")
+
+    def prune(self) -> int:
+        """Delete every expired entry and return how many were removed."""
+        with self._lock:
+            if self._db is None:
+                return 0
+            try:
+                cursor = self._db.execute(
+                    "DELETE FROM cache WHERE expires_at < ?", (time.time(),)
+                )
+                return cursor.rowcount
+            except Exception as e:
+                self.logger.error(f"Error pruning disk cache: {e}")
+                return 0
+
+    def _prune_due(self) -> bool:
+        """True when the last sweep is more than PRUNE_INTERVAL old; records a new one."""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT value FROM meta WHERE key = 'last_prune'"
+                ).fetchone()
+                if row is not None and now - row[0] < PRUNE_INTERVAL:
+                    return False
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_prune', ?)",
+                    (now,),
+                )
+            except Exception as e:
+                self.logger.error(f"Error reading disk cache: {e}")
+                return False
+        return True
+
+    def close(self):
+        """Drop expired entries (at most once per PRUNE_INTERVAL), then close the database."""
+        if self._db is not None and self._prune_due():
+            self.prune()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
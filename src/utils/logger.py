@@ -1,6 +1,21 @@
 import logging
 import os
-from functools import wraps
+from functools import lru_cache, wraps
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second of log output."""
+
+    _cached = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_text = self._cached
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            # One tuple assignment, so threads never see a mismatched pair
+            self._cached = (second, cached_text)
+        return cached_text
 
 
 def setup_logger(name="tv_show_renamer"):
@@ -11,7 +26,7 @@ def setup_logger(name="tv_show_renamer"):
         logger.setLevel(logging.INFO)
 
         # Create formatter
-        formatter = logging.Formatter(
+        formatter = _CachedTimeFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -27,16 +42,24 @@ def setup_logger(name="tv_show_renamer"):
     return logger
 
 
+# Environment variables whose values are masked in log output, with their
+# placeholders built once. Values are read per call: tmdbv3api sets
+# TMDB_API_KEY in the environment after startup.
+_SENSITIVE_ENV_VARS = tuple(
+    (name, f"[{name}_HIDDEN]")
+    for name in ("API_KEY", "TMDB_API_KEY", "TOKEN", "PASSWORD")
+)
+
+
 def sanitize_log_message(message: str) -> str:
     """Remove sensitive information from log messages."""
-    sensitive_keys = ["api_key", "TMDB_API_KEY", "token", "password"]
     sanitized_message = str(message)
+    environ = os.environ
 
-    for key in sensitive_keys:
-        if key.upper() in os.environ:
-            sanitized_message = sanitized_message.replace(
-                os.environ[key.upper()], f"[{key.upper()}_HIDDEN]"
-            )
+    for name, placeholder in _SENSITIVE_ENV_VARS:
+        value = environ.get(name)
+        if value:
+            sanitized_message = sanitized_message.replace(value, placeholder)
 
     return sanitized_message
 
@@ -56,20 +79,26 @@ def log_safely(func):
     return wrapper
 
 
+# Words that should be lowercase unless at start
+_ARTICLES = frozenset(
+    {"a", "an", "the", "in", "on", "at", "for", "to", "of", "with", "by"}
+)
+
+
+# Show and episode titles repeat across batches and searches; the result is pure
+@lru_cache(maxsize=4096)
 def format_show_name(name: str) -> str:
     """Format show name with consistent casing."""
     # Title case for the main text, preserving specific capitalizations
     words = name.strip().split()
     formatted_words = []
 
-    # Words that should be lowercase unless at start
-    articles = {"a", "an", "the", "in", "on", "at", "for", "to", "of", "with", "by"}
-
     for i, word in enumerate(words):
+        lower = word.lower()
         # First word or not an article: capitalize
-        if i == 0 or word.lower() not in articles:
+        if i == 0 or lower not in _ARTICLES:
             formatted_words.append(word.title())
         else:
-            formatted_words.append(word.lower())
+            formatted_words.append(lower)
 
     return " ".join(formatted_words)
@@ -0,0 +1,40 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept per host. The main window, renamer and show dialog pools can
+# have up to 16 lookups in flight; beyond maxsize, urllib3 opens throwaway
+# connections that each pay a fresh TLS handshake.
+POOL_MAXSIZE = 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_tmdb_session() -> requests.Session:
+    """Return the process-wide session used for TMDb requests.
+
+    Connections are kept alive and pooled, so only the first request pays for
+    the TLS handshake. Rate-limit and server errors are retried with backoff.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Hand the final response back so tmdbv3api reports the error
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry
+                ),
+            )
+            _session = session
+        return _session
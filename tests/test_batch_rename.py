@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from src.gui.main_window import AdvancedRenamer
+
+
+class TestDoRenames(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make(self, *names):
+        for name in names:
+            with open(self.path(name), "w") as f:
+                f.write(name)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def contents(self):
+        result = {}
+        for name in sorted(os.listdir(self.tmpdir.name)):
+            with open(self.path(name)) as f:
+                result[name] = f.read()
+        return result
+
+    def rename(self, *pairs):
+        pending = [(None, self.path(old), self.path(new)) for old, new in pairs]
+        return [status for status, _ in AdvancedRenamer._do_renames(pending)]
+
+    def test_independent_renames(self):
+        """Test a plain batch with no conflicts"""
+        self.make("a", "b")
+        self.assertEqual(self.rename(("a", "x"), ("b", "y")), ["Success", "Success"])
+        self.assertEqual(self.contents(), {"x": "a", "y": "b"})
+
+    def test_chain(self):
+        """Test that A->B, B->C moves B out of the way first"""
+        self.make("a", "b")
+        self.assertEqual(self.rename(("a", "b"), ("b", "c")), ["Success", "Success"])
+        self.assertEqual(self.contents(), {"b": "a", "c": "b"})
+
+    def test_chain_reversed(self):
+        """Test the same chain listed the other way round"""
+        self.make("a", "b")
+        self.assertEqual(self.rename(("b", "c"), ("a", "b")), ["Success", "Success"])
+        self.assertEqual(self.contents(), {"b": "a", "c": "b"})
+
+    def test_duplicate_targets(self):
+        """Test that two rows with the same new name are both rejected"""
+        self.make("a", "b")
+        statuses = self.rename(("a", "x"), ("b", "x"))
+        self.assertTrue(all(status.startswith("Error") for status in statuses))
+        self.assertEqual(self.contents(), {"a": "a", "b": "b"})
+
+    def test_cycle(self):
+        """Test that a swap is rejected instead of overwriting"""
+        self.make("a", "b")
+        statuses = self.rename(("a", "b"), ("b", "a"))
+        self.assertTrue(all(status.startswith("Error") for status in statuses))
+        self.assertEqual(self.contents(), {"a": "a", "b": "b"})
+
+    def test_existing_target(self):
+        """Test that a file outside the batch is never overwritten"""
+        self.make("a", "b")
+        self.assertEqual(self.rename(("a", "b")), ["Error: Target exists"])
+        self.assertEqual(self.contents(), {"a": "a", "b": "b"})
+
+
+if __name__ == '__main__':
+    unittest.main()
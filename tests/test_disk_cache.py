@@ -0,0 +1,84 @@
+import json
+import tempfile
+import unittest
+
+from src.utils.disk_cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.tmpdir.name)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_set_and_get(self):
+        """Test storing and reading back a value"""
+        self.cache.set("show:theoffice", {"id": 2316, "name": "The Office"})
+        self.assertEqual(self.cache.get("show:theoffice"), {"id": 2316, "name": "The Office"})
+        self.assertIsNone(self.cache.get("show:missing"))
+
+    def test_values_stored_as_json(self):
+        """Test that values are written as JSON text, not pickled"""
+        self.cache.set("episode:1:1:1", {"name": "Pilot", "air_date": None, "episode_number": 1})
+        raw = self.cache._db.execute(
+            "SELECT value FROM cache WHERE key = ?", ("episode:1:1:1",)
+        ).fetchone()[0]
+        self.assertIsInstance(raw, str)
+        self.assertEqual(json.loads(raw), {"name": "Pilot", "air_date": None, "episode_number": 1})
+
+    def test_unserializable_value(self):
+        """Test that a value JSON cannot represent is skipped, not stored"""
+        self.cache.set("bad", {"when": object()})
+        self.assertIsNone(self.cache.get("bad"))
+
+    def test_expired_entry(self):
+        """Test that an entry past its ttl reads as missing"""
+        self.cache.set("season:1:1", {"episodes": []}, ttl=-1)
+        self.cache.set("season:1:2", {"episodes": []}, ttl=60)
+        self.assertIsNone(self.cache.get("season:1:1"))
+        self.assertEqual(self.cache.get("season:1:2"), {"episodes": []})
+
+    def test_persists_across_instances(self):
+        """Test that a new cache on the same directory sees earlier writes"""
+        self.cache.set("episode:1:1:1", {"name": "Pilot"})
+        self.cache.close()
+
+        self.cache = DiskCache(self.tmpdir.name)
+        self.assertEqual(self.cache.get("episode:1:1:1"), {"name": "Pilot"})
+
+    def test_closed_cache(self):
+        """Test that a closed cache ignores reads and writes"""
+        self.cache.close()
+        self.cache.set("show:theoffice", {"id": 2316})
+        self.assertIsNone(self.cache.get("show:theoffice"))
+
+    def test_prune(self):
+        """Test that prune removes only expired entries"""
+        self.cache.set("a", 1, ttl=-1)
+        self.cache.set("b", 2, ttl=-1)
+        self.cache.set("c", 3, ttl=60)
+        self.cache.set("d", 4)
+        self.assertEqual(self.cache.prune(), 2)
+        self.assertEqual(self.cache.get("c"), 3)
+        self.assertEqual(self.cache.get("d"), 4)
+
+    def test_close_prunes_once_per_interval(self):
+        """Test that close sweeps on the first run but not again within PRUNE_INTERVAL"""
+        count = "SELECT COUNT(*) FROM cache"
+        self.cache.set("a", 1, ttl=-1)
+        self.cache.close()
+
+        self.cache = DiskCache(self.tmpdir.name)
+        self.assertEqual(self.cache._db.execute(count).fetchone()[0], 0)
+        self.cache.set("b", 2, ttl=-1)
+        self.cache.close()
+
+        self.cache = DiskCache(self.tmpdir.name)
+        self.assertEqual(self.cache._db.execute(count).fetchone()[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
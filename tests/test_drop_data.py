@@ -0,0 +1,36 @@
+import logging
+import unittest
+from types import SimpleNamespace
+
+from src.gui.main_window import AdvancedRenamer
+
+
+def parse(data):
+    # parse_drop_data only needs a logger, so no Tk window is created
+    return AdvancedRenamer.parse_drop_data(SimpleNamespace(logger=logging.getLogger(__name__)), data)
+
+
+class TestParseDropData(unittest.TestCase):
+    def test_plain_paths(self):
+        """Test space-separated paths without spaces in them"""
+        self.assertEqual(parse("/tv/a.mkv /tv/b.mkv"), ["/tv/a.mkv", "/tv/b.mkv"])
+
+    def test_braced_paths(self):
+        """Test that Tk's braces keep paths with spaces together"""
+        self.assertEqual(
+            parse("{/tv/My Show/a.mkv} /tv/b.mkv {C:/TV Shows/c.mkv}"),
+            ["/tv/My Show/a.mkv", "/tv/b.mkv", "C:/TV Shows/c.mkv"],
+        )
+
+    def test_empty(self):
+        """Test empty drops and empty braces"""
+        self.assertEqual(parse(""), [])
+        self.assertEqual(parse("{} "), [])
+
+    def test_sequence_input(self):
+        """Test that an already split tuple of paths is returned as a list"""
+        self.assertEqual(parse(("/tv/a b.mkv", "/tv/c.mkv")), ["/tv/a b.mkv", "/tv/c.mkv"])
+
+
+if __name__ == '__main__':
+    unittest.main()
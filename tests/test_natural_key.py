@@ -0,0 +1,33 @@
+import unittest
+
+from src.gui.widgets.file_list import _natural_key
+
+
+class TestNaturalKey(unittest.TestCase):
+    def test_numbers_sort_numerically(self):
+        """Test that embedded numbers compare by value, not character by character"""
+        names = ["Show E10.mkv", "Show E2.mkv", "Show E1.mkv"]
+        self.assertEqual(
+            sorted(names, key=_natural_key),
+            ["Show E1.mkv", "Show E2.mkv", "Show E10.mkv"],
+        )
+
+    def test_case_insensitive(self):
+        """Test that letter case does not affect the order"""
+        self.assertEqual(sorted(["b.mkv", "A.mkv", "c.mkv"], key=_natural_key), ["A.mkv", "b.mkv", "c.mkv"])
+
+    def test_mixed_text_and_numbers(self):
+        """Test names where a number and text meet at the same position"""
+        names = ["10 - Finale.mkv", "Extras.mkv", "2 - Second.mkv", ""]
+        self.assertEqual(
+            sorted(names, key=_natural_key),
+            ["", "2 - Second.mkv", "10 - Finale.mkv", "Extras.mkv"],
+        )
+
+    def test_non_string_values(self):
+        """Test that non-string cell values are keyed by their text"""
+        self.assertEqual(_natural_key(12), ["", 12, ""])
+
+
+if __name__ == '__main__':
+    unittest.main()
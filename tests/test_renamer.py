@@ -0,0 +1,99 @@
+import logging
+import random
+import unittest
+from types import SimpleNamespace
+
+from src.core.renamer import _SHOW_RE, TVShowRenamer, _scan_sxxexx
+
+
+def _regex_groups(name):
+    """What _SHOW_RE's first (SxxExx) alternative captures, or None"""
+    match = _SHOW_RE.search(name)
+    if match is None or match.lastgroup != "p0":
+        return None
+    return match.group("show0", "season0", "episode0")
+
+
+class TestScanSxxExx(unittest.TestCase):
+    def test_standard_names(self):
+        """Test the usual SxxExx spellings"""
+        self.assertEqual(_scan_sxxexx("Show.Name.S01E02.720p.mkv"), ("Show.Name", "1", "02"))
+        self.assertEqual(_scan_sxxexx("Show S1E2.mkv"), ("Show", "1", "2"))
+        self.assertEqual(_scan_sxxexx("Show_S01E02.mkv"), ("Show", "1", "02"))
+        self.assertEqual(_scan_sxxexx("show.name.s13e04.mkv"), ("show.name", "13", "04"))
+
+    def test_leading_zero_backtracking(self):
+        """Test the optional zero before the season, including regex backtracking"""
+        self.assertEqual(_scan_sxxexx("Show.S001E02.mkv"), ("Show", "01", "02"))
+        self.assertEqual(_scan_sxxexx("Show.S0E05.mkv"), ("Show", "0", "05"))
+        self.assertIsNone(_scan_sxxexx("Show.S0012E05.mkv"))
+
+    def test_digit_limits(self):
+        """Test that season and episode stop at two digits"""
+        self.assertEqual(_scan_sxxexx("Show.s10e100.mkv"), ("Show", "10", "10"))
+        self.assertIsNone(_scan_sxxexx("Show.S123E01.mkv"))
+
+    def test_first_separator_wins(self):
+        """Test that the shortest show name is taken, like the lazy regex"""
+        self.assertEqual(
+            _scan_sxxexx("Show.S01E02.Also.S03E04.mkv"), ("Show", "1", "02")
+        )
+        self.assertEqual(_scan_sxxexx("Sons.of.Anarchy.S02E03.mkv"), ("Sons.of.Anarchy", "2", "03"))
+
+    def test_no_match(self):
+        """Test names the scanner leaves to the other patterns"""
+        self.assertIsNone(_scan_sxxexx("Show.Name.1x02.mkv"))
+        self.assertIsNone(_scan_sxxexx("S01E02.mkv"))
+        self.assertIsNone(_scan_sxxexx("Show.Name.mkv"))
+        self.assertIsNone(_scan_sxxexx(""))
+
+    def test_non_ascii_falls_back_to_regex(self):
+        """Test that non-ASCII names are left to _SHOW_RE"""
+        name = "Café.Society.S01E02.mkv"
+        self.assertIsNone(_scan_sxxexx(name))
+        self.assertEqual(_regex_groups(name), ("Café.Society", "1", "02"))
+
+    def test_matches_regex(self):
+        """Test that the scanner and _SHOW_RE agree on the same inputs"""
+        names = [
+            "Show.Name.S01E02.mkv",
+            "Show S1E2",
+            "Show.S001E02",
+            "Show.s10e100",
+            "Show_S01E02",
+            "Show.Name.1x02.mkv",
+            "Show.Name.102.mkv",
+            "Show.Name.Season.1.Episode.02.mkv",
+            "Show.Name.E02.S01.mkv",
+            "Show\nName.S01E02",
+            "A.S.S01E02",
+            "Show. S01E2",
+        ]
+        rng = random.Random(0)
+        alphabet = "sSeE0123456789._ -x"
+        names += ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(5000)]
+
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(_scan_sxxexx(name), _regex_groups(name))
+
+
+class TestExtractEpisodeNumber(unittest.TestCase):
+    def extract(self, filename):
+        # Only the logger is needed, so no TMDb client is created
+        renamer = SimpleNamespace(logger=logging.getLogger(__name__))
+        return TVShowRenamer.extract_episode_number(renamer, filename)
+
+    def test_common_formats(self):
+        """Test the usual episode spellings"""
+        self.assertEqual(self.extract("Show.S01E02.mkv"), 2)
+        self.assertEqual(self.extract("Show.1x05.mkv"), 5)
+        self.assertEqual(self.extract("07 - Title.mkv"), 7)
+
+    def test_three_digit_episode(self):
+        """Test that E123 is read whole rather than falling back to the season digits"""
+        self.assertEqual(self.extract("Show.S01E123.mkv"), 123)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from datetime import datetime
+
+from src.core.models.undo_batch import UndoBatch
+
+
+class TestUndoBatch(unittest.TestCase):
+    def test_round_trip(self):
+        """Test that from_dict reads back what to_dict writes"""
+        batch = UndoBatch(1700000000.5, [], [])
+        batch.add("/tv/Show-S01E01-Pilot.mkv", "show.s01e01.mkv")
+        batch.add("/tv/Show-S01E02-Second.mkv", "show.s01e02.mkv")
+
+        restored = UndoBatch.from_dict(batch.to_dict())
+        self.assertEqual(restored, batch)
+        self.assertEqual(len(restored), 2)
+
+    def test_legacy_files_format(self):
+        """Test reading the older {"timestamp": iso, "files": [...]} undo log entries"""
+        timestamp = "2024-05-01T12:30:00"
+        data = {
+            "timestamp": timestamp,
+            "files": [
+                ["/tv/Show-S01E01-Pilot.mkv", "show.s01e01.mkv"],
+                ["/tv/Show-S01E02-Second.mkv", "show.s01e02.mkv"],
+            ],
+        }
+
+        batch = UndoBatch.from_dict(data)
+        self.assertEqual(batch.timestamp, datetime.fromisoformat(timestamp).timestamp())
+        self.assertEqual(batch.paths, ["/tv/Show-S01E01-Pilot.mkv", "/tv/Show-S01E02-Second.mkv"])
+        self.assertEqual(batch.names, ["show.s01e01.mkv", "show.s01e02.mkv"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,70 @@
 import os
 import ast
+import math
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Set, Tuple
 
+# Below this many files, scan_project parses in-process
+PARALLEL_MIN_FILES = 64
+# Larger source files are skipped
+MAX_FILE_SIZE = 512 * 1024
+
+
+# Nodes that can contain statements; expressions never do, so they are skipped
+_STATEMENT_CONTAINERS = tuple(
+    getattr(ast, name) for name in ("stmt", "excepthandler", "match_case") if hasattr(ast, name)
+)
+
+
+def _walk_statements(tree: ast.AST):
+    """Like ast.walk, in the same breadth-first order, but never descends into
+    expressions. Class, function and import nodes are all statements, so this
+    finds the same nodes while skipping the bulk of the tree."""
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        todo.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _STATEMENT_CONTAINERS)
+        )
+        yield node
+
+
+def _parse_file(file_path: str) -> Tuple[str, List[str], List[str], List[str], str]:
+    """Parse one file into (path, class names, function names, imports, error).
+
+    Module-level and returning plain lists so it can run in a worker process.
+    """
+    classes, functions, imports = [], [], []
+    try:
+        # Oversized files are generated code, not something to audit by hand
+        if os.stat(file_path).st_size > MAX_FILE_SIZE:
+            return file_path, [], [], [], f"skipped, larger than {MAX_FILE_SIZE // 1024} KB"
+
+        # Bytes go straight to the parser, which honours PEP 263 coding cookies
+        with open(file_path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=file_path)
+
+        for node in _walk_statements(tree):
+            if isinstance(node, ast.ClassDef):
+                classes.append(node.name)
+            elif isinstance(node, ast.FunctionDef):
+                functions.append(node.name)
+            elif isinstance(node, ast.Import):
+                for name in node.names:
+                    imports.append(name.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports.append(node.module)
+
+    except Exception as e:
+        return file_path, [], [], [], str(e)
+
+    return file_path, classes, functions, imports, ""
+
+
 class CodeAuditor:
     def __init__(self, project_root: str):
         self.project_root = project_root
@@ -14,32 +75,38 @@ class CodeAuditor:
 
     def scan_project(self):
         """Recursively scan Python files in the project."""
-        for root, _, files in os.walk(self.project_root):
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    self._analyze_file(file_path)
+        file_paths = [
+            os.path.join(root, file)
+            for root, _, files in os.walk(self.project_root)
+            for file in files
+            if file.endswith('.py')
+        ]
+
+        # Parsing is CPU-bound, so large trees are spread over processes;
+        # small ones are not worth the worker start-up cost
+        if len(file_paths) < PARALLEL_MIN_FILES:
+            results = map(_parse_file, file_paths)
+            self._merge_results(results)
+        else:
+            with ProcessPoolExecutor() as executor:
+                self._merge_results(executor.map(_parse_file, file_paths, chunksize=16))
 
     def _analyze_file(self, file_path: str):
         """Analyze a single Python file for definitions and imports."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read(), filename=file_path)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    self.class_definitions[node.name].append(file_path)
-                elif isinstance(node, ast.FunctionDef):
-                    self.function_definitions[node.name].append(file_path)
-                elif isinstance(node, ast.Import):
-                    for name in node.names:
-                        self.imports[file_path].add(name.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        self.imports[file_path].add(node.module)
-
-        except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
+        self._merge_results([_parse_file(file_path)])
+
+    def _merge_results(self, results):
+        """Fold _parse_file results into the definition and import indexes."""
+        for file_path, classes, functions, imports, error in results:
+            if error:
+                print(f"Error analyzing {file_path}: {error}")
+                continue
+            for name in classes:
+                self.class_definitions[name].append(file_path)
+            for name in functions:
+                self.function_definitions[name].append(file_path)
+            if imports:
+                self.imports[file_path].update(imports)
 
     def find_duplicates(self) -> Tuple[Dict, Dict]:
         """Find duplicate class and function definitions."""
@@ -54,12 +121,40 @@ class CodeAuditor:
         from difflib import SequenceMatcher
 
         all_names = list(self.class_definitions.keys()) + list(self.function_definitions.keys())
-        
-        for i, name1 in enumerate(all_names):
-            for name2 in all_names[i+1:]:
-                similarity = SequenceMatcher(None, name1.lower(), name2.lower()).ratio()
-                if similarity >= threshold:
-                    self.similar_names[name1].append(name2)
+        lowered = [name.lower() for name in all_names]
+
+        # ratio() is 2*matches/(len1 + len2) and matches <= the shorter length,
+        # so only names of nearly equal length can reach the threshold
+        by_length: Dict[int, List[int]] = defaultdict(list)
+        for index, name in enumerate(lowered):
+            by_length[len(name)].append(index)
+
+        matches = []
+        matcher = SequenceMatcher(None)
+        for j, name2 in enumerate(lowered):
+            # set_seq2 caches its analysis of name2 across every comparison
+            matcher.set_seq2(name2)
+            length2 = len(name2)
+            # Bounds are widened by one to absorb float rounding; ratio() decides
+            for length1 in range(
+                max(0, math.ceil(threshold * length2 / (2 - threshold)) - 1),
+                math.floor(length2 * (2 - threshold) / threshold) + 2,
+            ):
+                for i in by_length.get(length1, ()):
+                    if i >= j:
+                        break
+                    matcher.set_seq1(lowered[i])
+                    # Cheap upper bounds first, full ratio() only if they pass
+                    if (
+                        matcher.real_quick_ratio() >= threshold
+                        and matcher.quick_ratio() >= threshold
+                        and matcher.ratio() >= threshold
+                    ):
+                        matches.append((i, j))
+
+        # Report pairs in the same order as a plain pairwise scan
+        for i, j in sorted(matches):
+            self.similar_names[all_names[i]].append(all_names[j])
 
         return self.similar_names
 